@@ -6,12 +6,8 @@ Main entry point for the application
 
 import sys
 import os
-from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from gui.main_window import MSLearnGUIApp
+from src.gui.main_window import MSLearnGUIApp
 
 def main():
     """Main entry point for the application"""
@@ -3,14 +3,29 @@ Settings management for MS Learn GUI Data Generator
 Handles persistent configuration storage and retrieval
 """
 
-import json
+import orjson
 import os
+import atexit
+import threading
+import weakref
+from collections import deque
 from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Live Settings instances, held weakly so the exit hook doesn't keep them alive
+_instances = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    """Make sure pending deferred saves survive interpreter shutdown"""
+    for settings in list(_instances):
+        settings.flush()
+
+
 class Settings:
     """
     Manages application settings with JSON persistence
@@ -18,6 +33,7 @@ class Settings:
     
     DEFAULT_SETTINGS = {
         "window_size": [1200, 800],
+        "window_position": None,  # [x, y] of the last session; None centers the window
         "default_output_dir": str(Path.home() / "Documents" / "MSLearn_Output"),
         "quality_threshold": 100,
         "delay_seconds": 2,
@@ -30,6 +46,9 @@ class Settings:
         "timeout_seconds": 30
     }
     
+    # Auto-save delay - a burst of set() calls results in a single write
+    SAVE_DELAY_SECONDS = 0.5
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize settings manager
@@ -46,7 +65,12 @@ class Settings:
             self.config_file = config_dir / "settings.json"
         
         self.settings: Dict[str, Any] = {}
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
         self.load()
+        
+        # Pending deferred saves are written by _flush_all at interpreter exit
+        _instances.add(self)
     
     def load(self) -> None:
         """
@@ -54,8 +78,8 @@ class Settings:
         """
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    loaded_settings = orjson.loads(f.read())
                     # Merge with defaults to ensure all keys exist
                     self.settings = {**self.DEFAULT_SETTINGS, **loaded_settings}
                 logger.info(f"Settings loaded from {self.config_file}")
@@ -70,12 +94,42 @@ class Settings:
         """
         Save current settings to configuration file
         """
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
-            logger.info(f"Settings saved to {self.config_file}")
-        except Exception as e:
-            logger.error(f"Error saving settings: {e}")
+        with self._save_lock:
+            self._cancel_pending_save()
+            try:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
+                logger.info(f"Settings saved to {self.config_file}")
+            except Exception as e:
+                logger.error(f"Error saving settings: {e}")
+    
+    def flush(self) -> None:
+        """
+        Write a pending deferred save immediately, if there is one
+        """
+        with self._save_lock:
+            pending = self._save_timer is not None
+        
+        if pending:
+            self.save()
+    
+    def _schedule_save(self) -> None:
+        """
+        Schedule a deferred save, restarting the delay if one is pending
+        """
+        with self._save_lock:
+            self._cancel_pending_save()
+            self._save_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _cancel_pending_save(self) -> None:
+        """
+        Cancel any pending deferred save (caller must hold _save_lock)
+        """
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -100,7 +154,16 @@ class Settings:
         """
         self.settings[key] = value
         if self.get("auto_save", True):
-            self.save()
+            self._schedule_save()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a shallow copy of all current settings
+        
+        Returns:
+            Dictionary of setting keys and values
+        """
+        return dict(self.settings)
     
     def update(self, updates: Dict[str, Any]) -> None:
         """
@@ -111,7 +174,7 @@ class Settings:
         """
         self.settings.update(updates)
         if self.get("auto_save", True):
-            self.save()
+            self._schedule_save()
     
     def reset(self) -> None:
         """
@@ -120,27 +183,41 @@ class Settings:
         self.settings = self.DEFAULT_SETTINGS.copy()
         self.save()
     
-    def add_recent_url_list(self, file_path: str, max_items: int = 10) -> None:
+    def _add_recent(self, key: str, value: str, max_items: int) -> None:
         """
-        Add a file to recent URL lists
+        Move a value to the front of a bounded most-recent-first list
         
         Args:
-            file_path: Path to URL list file
+            key: Setting key holding the list
+            value: Value to add
             max_items: Maximum number of recent items to keep
         """
-        recent = self.get("recent_url_lists", [])
+        current = self.get(key, [])
+        
+        # Already the most recent entry - nothing to persist
+        if current[:1] == [value] and len(current) <= max_items:
+            return
+        
+        recent = deque(current[:max_items], maxlen=max_items)
         
         # Remove if already exists
-        if file_path in recent:
-            recent.remove(file_path)
+        if value in recent:
+            recent.remove(value)
         
-        # Add to beginning
-        recent.insert(0, file_path)
+        # Add to beginning (oldest entry drops off when full)
+        recent.appendleft(value)
         
-        # Limit size
-        recent = recent[:max_items]
+        self.set(key, list(recent))
+    
+    def add_recent_url_list(self, file_path: str, max_items: int = 10) -> None:
+        """
+        Add a file to recent URL lists
         
-        self.set("recent_url_lists", recent)
+        Args:
+            file_path: Path to URL list file
+            max_items: Maximum number of recent items to keep
+        """
+        self._add_recent("recent_url_lists", file_path, max_items)
     
     def add_recent_category(self, category: str, max_items: int = 10) -> None:
         """
@@ -150,16 +227,4 @@ class Settings:
             category: Category name
             max_items: Maximum number of recent items to keep
         """
-        recent = self.get("recent_categories", [])
-        
-        # Remove if already exists
-        if category in recent:
-            recent.remove(category)
-        
-        # Add to beginning
-        recent.insert(0, category)
-        
-        # Limit size
-        recent = recent[:max_items]
-        
-        self.set("recent_categories", recent)
+        self._add_recent("recent_categories", category, max_items)
@@ -4,5 +4,6 @@ Contains the backend logic and data processing
 """
 
 from .mslearn_generator import MSLearnTrainingDataGenerator
+from .url_cache import URLCache
 
-__all__ = ['MSLearnTrainingDataGenerator']
+__all__ = ['MSLearnTrainingDataGenerator', 'URLCache']
@@ -16,26 +16,361 @@ Attribution 4.0 International License, explicitly permitting AI training use.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import time
 import re
-from bs4 import BeautifulSoup
+import threading
+import functools
+import hashlib
+import contextlib
+import mmap
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from lxml import etree, html
+from cssselect import GenericTranslator
 from pathlib import Path
 import logging
 from urllib.parse import urlparse
 
+try:
+    from .url_cache import URLCache
+except ImportError:  # Running as a standalone script
+    from url_cache import URLCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+# CSS selectors are translated to XPath once at import, not per page
+_css_translator = GenericTranslator()
+
+def _css_xpath(selector):
+    """Compile a CSS selector (or selector group) to a reusable XPath"""
+    return etree.XPath(_css_translator.css_to_xpath(selector))
+
+
+# Navigation and non-content elements, removed in a single XPath pass
+_NAV_XPATH = _css_xpath(', '.join([
+    'nav', 'header', 'footer', 'aside',
+    '[data-bi-name="navigation"]',
+    '[data-bi-name="breadcrumb"]',
+    '[data-bi-name="recommendation"]',
+    '.breadcrumb',
+    '.recommendation-list',
+    '.page-metadata',
+    '.feedback-section',
+    '.page-actions',
+    '.content-footer',
+    '.uhf-header',
+    '.uhf-footer',
+    '.banner',
+    '.alert',
+    '.notification'
+]))
+
+# Subtrees dropped while the page is still streaming in - navigation
+# landmarks plus script/style/template bodies, which never hold page text
+_STREAM_PRUNE_TAGS = ('nav', 'header', 'footer', 'aside', 'script', 'style', 'template')
+
+# Download chunk size fed to the incremental HTML parser
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _parse_html_stream(chunks):
+    """Incrementally parse HTML byte chunks, pruning non-content subtrees"""
+    parser = etree.HTMLPullParser(events=('end',), tag=_STREAM_PRUNE_TAGS)
+    parser.set_element_class_lookup(html.HtmlElementClassLookup())
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            element.drop_tree()
+    
+    root = parser.close()
+    for _, element in parser.read_events():
+        element.drop_tree()
+    
+    return root
+
+
+# Main content candidates (MS Learn specific), tried in order
+_CONTENT_XPATHS = tuple(_css_xpath(selector) for selector in (
+    'main[role="main"]',
+    'main#main',
+    '[data-bi-name="content"]',
+    '.content',
+    '#content',
+    'article',
+    '.mainContent'
+))
+
+_TITLE_XPATH = etree.XPath('(//h1)[1]')
+_CODE_XPATH = _css_xpath('pre code, .code-snippet')
+
+# Code example normalization - trailing whitespace per line, size cap per example
+_CODE_TRAILING_WS_RE = re.compile(r'[ \t]+$', re.MULTILINE)
+MAX_CODE_EXAMPLE_CHARS = 2048
+
+# Text cleanup patterns - navigation phrases fused into one alternation
+_WHITESPACE_RE = re.compile(r'\s+')
+_NAV_TEXT_RE = re.compile('|'.join([
+    r'Skip to main content',
+    r'Profile.*?Sign out',
+    r'Microsoft Ignite.*?\d{4}',
+    r'\[.*?\]',  # Remove bracketed navigation items
+    r'Table of contents',
+    r'In this article',
+    r'Feedback',
+    r'Was this page helpful\?',
+]), re.IGNORECASE)
+
+# Windows Server/PowerShell relevance keywords, matched in a single scan
+_QUALITY_KEYWORDS = frozenset([
+    'windows server', 'active directory', 'powershell',
+    'dns', 'dhcp', 'group policy', 'azure', 'microsoft',
+    'cmdlet', 'administrator', 'domain controller'
+])
+_KEYWORD_RE = re.compile('|'.join(
+    re.escape(kw) for kw in sorted(_QUALITY_KEYWORDS, key=len, reverse=True)
+), re.IGNORECASE)
+
+# Content quality thresholds, checked cheapest first
+MIN_CONTENT_LENGTH = 300
+MIN_KEYWORD_MATCHES = 2
+MIN_QUALITY_SCORE = 100
+
+# Navigation cleanup and keyword scan fused into one pass over page text
+_CLEAN_SCAN_RE = re.compile(
+    f'(?P<nav>{_NAV_TEXT_RE.pattern})|(?P<keyword>{_KEYWORD_RE.pattern})',
+    re.IGNORECASE
+)
+
+
+def _clean_and_scan(text):
+    """Clean page text and count distinct quality keywords in the same pass"""
+    if not text:
+        return "", 0
+    
+    keywords = set()
+    
+    def _replace(match):
+        keyword = match.group('keyword')
+        if keyword is None:
+            return ''  # Navigation text
+        keywords.add(keyword.lower())
+        return keyword
+    
+    text = _WHITESPACE_RE.sub(' ', text.strip())
+    text = _CLEAN_SCAN_RE.sub(_replace, text)
+    text = _WHITESPACE_RE.sub(' ', text.strip())
+    
+    return text, len(keywords)
+
+
+def _clean_text(text):
+    """Enhanced text cleaning with better normalization"""
+    if not text:
+        return ""
+    
+    # Remove extra whitespace and normalize
+    text = _WHITESPACE_RE.sub(' ', text.strip())
+    
+    # Remove common navigation text patterns (single pass)
+    text = _NAV_TEXT_RE.sub('', text)
+    
+    # Clean up remaining artifacts
+    text = _WHITESPACE_RE.sub(' ', text.strip())
+    
+    return text
+
+
+def _normalize_code(code_text):
+    """Normalize line endings, drop trailing whitespace and cap code example size"""
+    code_text = code_text.replace('\r\n', '\n').replace('\r', '\n')
+    code_text = _CODE_TRAILING_WS_RE.sub('', code_text).strip()
+    return code_text[:MAX_CODE_EXAMPLE_CHARS]
+
+
+def _extract_from_tree(tree, url):
+    """Extract title, text and code examples from a parsed page"""
+    # Remove remaining navigation elements (drop_tree keeps tail text)
+    for element in _NAV_XPATH(tree):
+        element.drop_tree()
+    
+    # Try multiple content selectors (MS Learn specific)
+    content = None
+    for content_xpath in _CONTENT_XPATHS:
+        matches = content_xpath(tree)
+        if matches:
+            content = matches[0]
+            break
+    
+    if content is None:
+        # Fallback to body if no specific content area found
+        content = tree.find('body')
+    
+    if content is None:
+        return None
+    
+    # Extract title
+    title = ""
+    title_elems = _TITLE_XPATH(tree)
+    if title_elems:
+        title = _clean_text(title_elems[0].text_content())
+    
+    # Extract main content (keywords are counted while cleaning). Cleaning only
+    # shrinks text, so a page already under the minimum length is rejected by
+    # validation regardless - skip the keyword scan for it
+    raw_text = content.text_content()
+    if len(raw_text) < MIN_CONTENT_LENGTH:
+        text_content, keyword_matches = _clean_text(raw_text), None
+    else:
+        text_content, keyword_matches = _clean_and_scan(raw_text)
+    
+    # Extract code examples (normalized, capped and de-duplicated in page order)
+    code_examples = {}
+    for code_elem in _CODE_XPATH(content):
+        code_text = _normalize_code(code_elem.text_content())
+        if code_text:
+            code_examples[code_text] = None
+            if len(code_examples) == 5:  # Limit to 5 examples
+                break
+    
+    return {
+        'title': title,
+        'content': text_content,
+        'code_examples': list(code_examples),
+        'keyword_matches': keyword_matches,
+        'url': url
+    }
+
+
+def extract_from_bytes(url, raw_page):
+    """Parse a downloaded MS Learn page into content data
+    
+    Self-contained (no generator state) so it can run in a worker process.
+    """
+    return _extract_from_tree(_parse_html_stream((raw_page,)), url)
+
+
+# URL path patterns per category, checked in priority order
+_URL_CATEGORIES = (
+    ('Active Directory', ('identity', 'ad-ds', 'active-directory')),
+    ('DNS', ('dns', 'domain-name')),
+    ('DHCP', ('dhcp', 'dynamic-host')),
+    ('PowerShell', ('powershell', 'scripting')),
+    ('Security', ('security', 'authentication', 'kerberos')),
+    ('Networking', ('networking', 'network', 'tcp', 'ip')),
+    ('Administration', ('admin', 'manage', 'management')),
+    ('Deployment', ('deploy', 'install', 'setup', 'configure')),
+    ('Troubleshooting', ('troubleshoot', 'debug', 'diagnostic')),
+)
+
+
+# One anchored alternative per category, tried in priority order: each
+# lookahead scans the URL for any of its patterns and the empty named group
+# reports which category matched (first category wins, as before)
+_URL_CATEGORY_RE = re.compile('|'.join(
+    f"(?=.*?(?:{'|'.join(map(re.escape, patterns))}))(?P<category{index}>)"
+    for index, (_, patterns) in enumerate(_URL_CATEGORIES)
+), re.DOTALL)
+_URL_CATEGORY_GROUPS = {
+    f'category{index}': category for index, (category, _) in enumerate(_URL_CATEGORIES)
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _categorize_url(url_lower):
+    """Map a lowercased URL to its content category"""
+    match = _URL_CATEGORY_RE.match(url_lower)
+    return _URL_CATEGORY_GROUPS[match.lastgroup] if match else 'General'
+
+
+def _url_key(url):
+    """Compact 8-byte digest used to track processed URLs"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest()
+
+
+# Extracted content cache, stored alongside the generated datasets
+URL_CACHE_FILENAME = ".url_cache.sqlite3"
+
+# Write buffer for JSONL output (batches many small item writes per syscall)
+PROGRESS_BUFFER_SIZE = 1 << 20
+
+# JSON string values in the progress checkpoint, matched on raw bytes so resuming
+# never decodes the (large) training text of each item
+_PROGRESS_SOURCE_RE = re.compile(rb'"source"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_PROGRESS_CATEGORY_RE = re.compile(rb'"category"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+def _scan_progress_file(progress_file):
+    """Read sources and categories from a progress checkpoint without decoding items
+    
+    Returns (sources, categories, complete_size) where complete_size is the byte
+    length of the fully written lines (a crash may leave a partial last line).
+    """
+    with open(progress_file, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return [], [], 0
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            complete_size = mm.rfind(b'\n') + 1
+            
+            sources = [
+                orjson.loads(b'"' + m.group(1) + b'"')
+                for m in _PROGRESS_SOURCE_RE.finditer(mm, 0, complete_size)
+            ]
+            categories = [
+                orjson.loads(b'"' + m.group(1) + b'"')
+                for m in _PROGRESS_CATEGORY_RE.finditer(mm, 0, complete_size)
+            ]
+            
+            if len(sources) != len(categories) or (complete_size and not sources):
+                # Unexpected layout - fall back to decoding every line
+                sources, categories = [], []
+                for line in mm[:complete_size].splitlines():
+                    if line.strip():
+                        metadata = orjson.loads(line)['metadata']
+                        sources.append(metadata['source'])
+                        categories.append(metadata['category'])
+    
+    return sources, categories, complete_size
+
+
 class MSLearnTrainingDataGenerator:
-    def __init__(self, output_dir="output"):
+    def __init__(self, output_dir="output", max_workers=4, request_delay=2.0, max_retries=3,
+                 use_cache=True, parse_workers=0):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.processed_urls = set()
+        self.processed_urls = set()  # 8-byte URL digests (see _url_key)
         self.training_data = []
         
+        # Extracted content cache shared across runs (opened on first use)
+        self.url_cache = URLCache(self.output_dir / URL_CACHE_FILENAME) if use_cache else None
+        
+        # Parallel fetch settings - request_delay spaces out request starts
+        # across all workers so the crawl stays polite without idle stalls
+        self.max_workers = max(1, max_workers)
+        self.request_delay = request_delay
+        self.max_retries = max_retries
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        
+        # Worker processes for page parsing (0 = parse on the fetch threads)
+        self.parse_workers = parse_workers
+        
+        # Append-only progress checkpoint (opened on first write)
+        self._progress_fh = None
+        self._progress_path = None
+        self._items_written = 0
+        
+        # Items carried over from an earlier run's checkpoint (see resume_progress)
+        self._resumed_categories = Counter()
+        
         # Enhanced headers to mimic browser request
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -45,119 +380,101 @@ class MSLearnTrainingDataGenerator:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
+        
+        # Shared connection-pooled session (keep-alive across URLs)
+        self.session = self._create_session()
+
+    def _create_session(self):
+        """Create an HTTP session with connection pooling and retry logic"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        return session
+
+    def close(self):
+        """Release the URL cache connection (reopened on next use)"""
+        if self.url_cache:
+            self.url_cache.close()
+
+    def _wait_for_request_slot(self):
+        """Rate limiting - reserve the next request start time shared by all workers"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_time = max(now, self._next_request_time)
+            self._next_request_time = start_time + self.request_delay
+        
+        wait = start_time - now
+        if wait > 0:
+            time.sleep(wait)
 
     def clean_text(self, text):
         """Enhanced text cleaning with better normalization"""
-        if not text:
-            return ""
-        
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove common navigation text patterns
-        nav_patterns = [
-            r'Skip to main content',
-            r'Profile.*?Sign out',
-            r'Microsoft Ignite.*?\d{4}',
-            r'\[.*?\]',  # Remove bracketed navigation items
-            r'Table of contents',
-            r'In this article',
-            r'Feedback',
-            r'Was this page helpful\?',
-        ]
-        
-        for pattern in nav_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Clean up remaining artifacts
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        return text
-
-    def remove_navigation_elements(self, soup):
-        """Enhanced removal of navigation and non-content elements"""
-        # Remove navigation elements
-        nav_selectors = [
-            'nav', 'header', 'footer', 'aside',
-            '[data-bi-name="navigation"]',
-            '[data-bi-name="breadcrumb"]',
-            '[data-bi-name="recommendation"]',
-            '.breadcrumb',
-            '.recommendation-list',
-            '.page-metadata',
-            '.feedback-section',
-            '.page-actions',
-            '.content-footer',
-            '.uhf-header',
-            '.uhf-footer',
-            '.banner',
-            '.alert',
-            '.notification'
-        ]
-        
-        for selector in nav_selectors:
-            for element in soup.select(selector):
-                element.decompose()
-
-    def extract_content(self, url):
-        """Extract content from Microsoft Learn URL with enhanced targeting"""
+        return _clean_text(text)
+
+    def extract_content(self, url, parse_executor=None):
+        """Extract content from Microsoft Learn URL with enhanced targeting
+        
+        When parse_executor (a process pool) is given, the page is downloaded
+        here and parsed by extract_from_bytes in a worker process.
+        """
+        cached = self.url_cache.get(url) if self.url_cache else None
+        if cached and cached['fresh']:
+            logger.info(f"Using cached content for {url}")
+            return cached['content_data']
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'lxml')
+            # Revalidate stale cache entries with a conditional request
+            request_headers = {}
+            if cached:
+                if cached['etag']:
+                    request_headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    request_headers['If-Modified-Since'] = cached['last_modified']
             
-            # Remove navigation elements first
-            self.remove_navigation_elements(soup)
-            
-            # Try multiple content selectors (MS Learn specific)
-            content_selectors = [
-                'main[role="main"]',
-                'main#main',
-                '[data-bi-name="content"]',
-                '.content',
-                '#content',
-                'article',
-                '.mainContent'
-            ]
+            self._wait_for_request_slot()
+            with self.session.get(url, headers=request_headers, timeout=30, stream=True) as response:
+                if cached and response.status_code == 304:
+                    self.url_cache.touch(url)
+                    return cached['content_data']
+                
+                response.raise_for_status()
+                
+                if parse_executor is None:
+                    # Parse while downloading; bulky non-content subtrees are
+                    # dropped as soon as they close to cap peak memory
+                    tree = _parse_html_stream(response.iter_content(STREAM_CHUNK_SIZE))
+                else:
+                    raw_page = response.content
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
             
-            content = None
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    content = content_elem
-                    break
+            if parse_executor is None:
+                content_data = _extract_from_tree(tree, url)
+            else:
+                content_data = parse_executor.submit(extract_from_bytes, url, raw_page).result()
             
-            if not content:
-                # Fallback to body if no specific content area found
-                content = soup.body
+            if content_data and self.url_cache:
+                self.url_cache.set(url, content_data, etag, last_modified)
             
-            if content:
-                # Extract title
-                title = ""
-                title_elem = soup.select_one('h1')
-                if title_elem:
-                    title = self.clean_text(title_elem.get_text())
-                
-                # Extract main content
-                text_content = self.clean_text(content.get_text())
-                
-                # Extract code examples
-                code_examples = []
-                for code_elem in content.select('pre code, .code-snippet'):
-                    code_text = code_elem.get_text().strip()
-                    if code_text:
-                        code_examples.append(code_text)
-                
-                return {
-                    'title': title,
-                    'content': text_content,
-                    'code_examples': code_examples[:5],  # Limit to 5 examples
-                    'url': url
-                }
+            return content_data
                 
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
+            if cached:
+                logger.warning(f"Using stale cached content for {url}")
+                return cached['content_data']
         except Exception as e:
             logger.error(f"Error processing {url}: {e}")
         
@@ -170,56 +487,34 @@ class MSLearnTrainingDataGenerator:
         
         content = content_data['content']
         
-        # Check minimum length
-        if len(content) < 300:
-            return False, f"Content too short: {len(content)} characters"
-        
-        # Check for Windows Server/PowerShell related content
-        keywords = [
-            'windows server', 'active directory', 'powershell', 
-            'dns', 'dhcp', 'group policy', 'azure', 'microsoft',
-            'cmdlet', 'administrator', 'domain controller'
-        ]
+        # Check minimum length (cheapest check first - rejects before any scan)
+        content_length = len(content)
+        if content_length < MIN_CONTENT_LENGTH:
+            return False, f"Content too short: {content_length} characters"
         
-        content_lower = content.lower()
-        keyword_matches = sum(1 for kw in keywords if kw in content_lower)
+        # Check for Windows Server/PowerShell related content - counted during
+        # extraction; scan here only for content built some other way
+        keyword_matches = content_data.get('keyword_matches')
+        if keyword_matches is None:
+            keyword_matches = len({match.lower() for match in _KEYWORD_RE.findall(content)})
         
-        if keyword_matches < 2:
+        if keyword_matches < MIN_KEYWORD_MATCHES:
             return False, f"Low technical content relevance: {keyword_matches} keywords"
         
         # Calculate quality score
         quality_score = 0
-        quality_score += min(len(content) / 100, 50)  # Length score (max 50)
+        quality_score += min(content_length / 100, 50)  # Length score (max 50)
         quality_score += keyword_matches * 10  # Keyword score
         quality_score += len(content_data.get('code_examples', [])) * 20  # Code examples score
         
-        if quality_score < 100:
+        if quality_score < MIN_QUALITY_SCORE:
             return False, f"Quality score too low: {quality_score}"
         
         return True, f"Quality score: {quality_score}"
 
     def categorize_url(self, url):
         """Categorize URL based on content type"""
-        url_lower = url.lower()
-        
-        categories = {
-            'Active Directory': ['identity', 'ad-ds', 'active-directory'],
-            'DNS': ['dns', 'domain-name'],
-            'DHCP': ['dhcp', 'dynamic-host'],
-            'PowerShell': ['powershell', 'scripting'],
-            'Security': ['security', 'authentication', 'kerberos'],
-            'Networking': ['networking', 'network', 'tcp', 'ip'],
-            'Administration': ['admin', 'manage', 'management'],
-            'Deployment': ['deploy', 'install', 'setup', 'configure'],
-            'Troubleshooting': ['troubleshoot', 'debug', 'diagnostic']
-        }
-        
-        for category, patterns in categories.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    return category
-        
-        return 'General'
+        return _categorize_url(url.lower())
 
     def generate_training_item(self, content_data, category):
         """Generate training item in Qwen format"""
@@ -246,20 +541,24 @@ class MSLearnTrainingDataGenerator:
         title = content_data.get('title', 'Windows Server topic')
         user_prompt = f"Explain {title} in detail."
         
-        # Format content with code examples
-        assistant_response = content_data['content'][:6000]  # Limit length
+        # Format content with code examples (joined once, no repeated +=)
+        parts = [content_data['content'][:6000]]  # Limit length
         
-        if content_data.get('code_examples'):
-            assistant_response += "\n\nCode Examples:\n"
-            for i, code in enumerate(content_data['code_examples'][:3], 1):
-                assistant_response += f"\nExample {i}:\n```\n{code}\n```\n"
+        code_examples = content_data.get('code_examples')
+        if code_examples:
+            parts.append("\n\nCode Examples:\n")
+            parts.extend(
+                f"\nExample {i}:\n```\n{code}\n```\n"
+                for i, code in enumerate(code_examples[:3], 1)
+            )
         
         # Create training item
-        training_text = (
-            f"<|im_start|>system\n{system_prompt}<|im_end|>\n"
-            f"<|im_start|>user\n{user_prompt}<|im_end|>\n"
-            f"<|im_start|>assistant\n{assistant_response}<|im_end|>"
-        )
+        training_text = ''.join([
+            "<|im_start|>system\n", system_prompt,
+            "<|im_end|>\n<|im_start|>user\n", user_prompt,
+            "<|im_end|>\n<|im_start|>assistant\n", *parts,
+            "<|im_end|>"
+        ])
         
         return {
             'text': training_text,
@@ -303,116 +602,207 @@ class MSLearnTrainingDataGenerator:
             test_dir = self.output_dir / 'test_outputs'
             test_dir.mkdir(exist_ok=True)
             
-            # Save raw content
-            with open(test_dir / 'test_raw_content.txt', 'w', encoding='utf-8') as f:
-                f.write(f"Title: {content_data['title']}\n\n")
-                f.write(f"Content:\n{content_data['content']}\n\n")
-                if content_data.get('code_examples'):
-                    f.write(f"Code Examples:\n")
-                    for i, code in enumerate(content_data['code_examples'], 1):
-                        f.write(f"\nExample {i}:\n{code}\n")
+            # Build every payload in memory, then write each file in one call
+            raw_parts = [f"Title: {content_data['title']}\n\n", f"Content:\n{content_data['content']}\n\n"]
+            if content_data.get('code_examples'):
+                raw_parts.append("Code Examples:\n")
+                raw_parts.extend(
+                    f"\nExample {i}:\n{code}\n"
+                    for i, code in enumerate(content_data['code_examples'], 1)
+                )
             
-            # Save training format
-            with open(test_dir / 'test_training_format.txt', 'w', encoding='utf-8') as f:
-                f.write(training_item['text'])
-            
-            # Save as JSONL
-            with open(test_dir / 'test_training_item.jsonl', 'w', encoding='utf-8') as f:
-                f.write(json.dumps(training_item, ensure_ascii=False) + '\n')
+            outputs = {
+                'test_raw_content.txt': ''.join(raw_parts).encode('utf-8'),
+                'test_training_format.txt': training_item['text'].encode('utf-8'),
+                'test_training_item.jsonl': orjson.dumps(training_item, option=orjson.OPT_APPEND_NEWLINE),
+            }
+            for filename, payload in outputs.items():
+                (test_dir / filename).write_bytes(payload)
             
             logger.info(f"Test outputs saved to {test_dir}")
         
         return training_item
 
-    def process_url_list(self, urls, category_name="MS_Learn"):
+    def process_url_list(self, urls, category_name="MS_Learn", resume=False):
         """Process a list of URLs and generate training data"""
         logger.info(f"Processing {len(urls)} URLs")
         
-        for i, url in enumerate(urls, 1):
-            if url in self.processed_urls:
+        if resume:
+            self.resume_progress(category_name)
+        
+        pending_urls = []
+        for url in dict.fromkeys(urls):
+            if _url_key(url) in self.processed_urls:
                 logger.info(f"Skipping already processed URL: {url}")
                 continue
+            pending_urls.append(url)
+        
+        # Optional worker processes for CPU-bound parsing (bypasses the GIL)
+        parse_pool = (
+            ProcessPoolExecutor(max_workers=self.parse_workers)
+            if self.parse_workers > 0 else contextlib.nullcontext()
+        )
+        
+        # Fetch in parallel, handle results as they arrive
+        with parse_pool as parse_executor, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.extract_content, url, parse_executor): url
+                for url in pending_urls
+            }
             
-            logger.info(f"Processing {i}/{len(urls)}: {url}")
-            
-            # Extract content
-            content_data = self.extract_content(url)
-            
-            if not content_data:
-                logger.warning(f"Failed to extract content from {url}")
-                continue
-            
-            # Validate quality
-            is_valid, quality_msg = self.validate_content_quality(content_data)
-            
-            if not is_valid:
-                logger.warning(f"Skipping {url}: {quality_msg}")
-                continue
-            
-            # Generate training item
-            category = self.categorize_url(url)
-            training_item = self.generate_training_item(content_data, category)
-            
-            if training_item:
-                training_item['metadata']['quality_score'] = quality_msg
-                self.training_data.append(training_item)
-                self.processed_urls.add(url)
-                logger.info(f"Added training item: {training_item['metadata']['title']}")
-            
-            # Save progress periodically
-            if i % 10 == 0:
-                self.save_progress(category_name)
-            
-            # Rate limiting
-            time.sleep(2)
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                logger.info(f"Processing {i}/{len(futures)}: {url}")
+                
+                content_data = future.result()
+                
+                if not content_data:
+                    logger.warning(f"Failed to extract content from {url}")
+                    continue
+                
+                # Validate quality
+                is_valid, quality_msg = self.validate_content_quality(content_data)
+                
+                if not is_valid:
+                    logger.warning(f"Skipping {url}: {quality_msg}")
+                    continue
+                
+                # Generate training item
+                category = self.categorize_url(url)
+                training_item = self.generate_training_item(content_data, category)
+                
+                if training_item:
+                    training_item['metadata']['quality_score'] = quality_msg
+                    self.training_data.append(training_item)
+                    self.processed_urls.add(_url_key(url))
+                    self._write_progress(category_name)
+                    logger.info(f"Added training item: {training_item['metadata']['title']}")
+                
+                # Save progress periodically
+                if i % 10 == 0:
+                    self.save_progress(category_name)
         
         # Save final dataset
         self.save_final_dataset(category_name)
+        self.close()
+    
+    def _dataset_file(self, category_name, suffix):
+        """Build an output file path for the given category"""
+        return self.output_dir / f"{category_name.lower().replace(' ', '_')}_{suffix}"
+    
+    def resume_progress(self, category_name):
+        """Continue an interrupted run from its progress checkpoint
+        
+        URLs already in the checkpoint are marked as processed and new items are
+        appended to it, so the final dataset covers both runs.
+        """
+        progress_file = self._dataset_file(category_name, "progress.jsonl")
+        if not progress_file.exists():
+            return 0
+        
+        try:
+            sources, categories, complete_size = _scan_progress_file(progress_file)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not resume from {progress_file}: {e}")
+            return 0
+        
+        self._close_progress()
+        self._progress_fh = open(progress_file, 'ab', buffering=PROGRESS_BUFFER_SIZE)
+        self._progress_fh.truncate(complete_size)  # Drop a partially written last line
+        self._progress_path = progress_file
+        self._items_written = len(self.training_data)
+        
+        self.processed_urls.update(map(_url_key, sources))
+        self._resumed_categories = Counter(categories)
+        
+        logger.info(f"Resumed {len(sources)} items from {progress_file.name}")
+        return len(sources)
+    
+    def _write_progress(self, category_name):
+        """Append training items not yet written to the progress checkpoint"""
+        progress_file = self._dataset_file(category_name, "progress.jsonl")
+        
+        if self._progress_fh is not None and self._progress_path != progress_file:
+            self._close_progress()
+        
+        if self._progress_fh is None:
+            # Opened lazily on first write; the checkpoint mirrors training_data
+            self._progress_fh = open(progress_file, 'wb', buffering=PROGRESS_BUFFER_SIZE)
+            self._progress_path = progress_file
+            self._items_written = 0
+        
+        for item in self.training_data[self._items_written:]:
+            self._progress_fh.write(orjson.dumps(item) + b'\n')
+        self._items_written = len(self.training_data)
+    
+    def _close_progress(self):
+        """Close the progress checkpoint and return its path"""
+        progress_file = self._progress_path
+        if self._progress_fh is not None:
+            self._progress_fh.close()
+        
+        self._progress_fh = None
+        self._progress_path = None
+        self._items_written = 0
+        self._resumed_categories = Counter()
+        
+        return progress_file
     
     def save_progress(self, category_name):
         """Save progress checkpoint"""
-        progress_file = self.output_dir / f"{category_name.lower().replace(' ', '_')}_progress.jsonl"
-        
-        with open(progress_file, 'w', encoding='utf-8') as f:
-            for item in self.training_data:
-                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+        self._write_progress(category_name)
+        self._progress_fh.flush()
         
         logger.info(f"Progress saved: {len(self.training_data)} items")
     
     def save_final_dataset(self, category_name):
         """Save final training dataset"""
-        if not self.training_data:
+        resumed_categories = self._resumed_categories
+        if not self.training_data and not resumed_categories:
+            self._close_progress()
             logger.warning("No training data to save")
             return
         
         # Save as JSONL for training
-        final_file = self.output_dir / f"{category_name.lower().replace(' ', '_')}_training_data.jsonl"
-        
-        with open(final_file, 'w', encoding='utf-8') as f:
-            for item in self.training_data:
-                f.write(json.dumps(item, ensure_ascii=False) + '\n')
-        
-        # Save metadata
-        metadata_file = self.output_dir / f"{category_name.lower().replace(' ', '_')}_metadata.json"
+        final_file = self._dataset_file(category_name, "training_data.jsonl")
+        
+        if self._progress_path == self._dataset_file(category_name, "progress.jsonl"):
+            # Checkpoint already holds every item - promote it instead of rewriting
+            self._write_progress(category_name)
+            self._close_progress().replace(final_file)
+        else:
+            self._close_progress()
+            with open(final_file, 'wb', buffering=PROGRESS_BUFFER_SIZE) as f:
+                for item in self.training_data:
+                    f.write(orjson.dumps(item) + b'\n')
+        
+        # Save metadata - processed URLs are only kept as digests, so list the
+        # sources of the saved items (read back from the file when resumed)
+        if resumed_categories:
+            urls_processed = _scan_progress_file(final_file)[0]
+        else:
+            urls_processed = [item['metadata']['source'] for item in self.training_data]
+        
+        metadata_file = self._dataset_file(category_name, "metadata.json")
         metadata = {
-            "total_items": len(self.training_data),
+            "total_items": len(self.training_data) + sum(resumed_categories.values()),
             "categories": {},
-            "urls_processed": list(self.processed_urls),
+            "urls_processed": urls_processed,
             "extraction_date": time.strftime("%Y-%m-%d %H:%M:%S"),
             "license": "Creative Commons Attribution 4.0 International - Microsoft Learn",
             "source": f"Microsoft Learn {category_name} Documentation",
             "generator": "MS Learn Training Data Generator v1.0"
         }
         
-        # Count by category
-        for item in self.training_data:
-            category = item['metadata']['category']
-            metadata['categories'][category] = metadata['categories'].get(category, 0) + 1
+        # Count by category (including items resumed from an earlier run)
+        category_counts = Counter(resumed_categories)
+        category_counts.update(item['metadata']['category'] for item in self.training_data)
+        metadata['categories'] = dict(category_counts)
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        with open(metadata_file, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
         
-        logger.info(f"Final dataset saved: {len(self.training_data)} training items")
+        logger.info(f"Final dataset saved: {metadata['total_items']} training items")
         logger.info(f"Files: {final_file}, {metadata_file}")
         
         print(f"\nTraining data files saved to: {self.output_dir}")
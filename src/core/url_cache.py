@@ -0,0 +1,125 @@
+"""
+Persistent URL content cache for the MS Learn Training Data Generator
+Purpose: Avoid re-fetching and re-parsing pages across generator runs
+
+Features:
+- SQLite-backed storage (standard library, safe across worker threads)
+- Least-recently-used eviction once the entry limit is reached
+- Freshness window, after which entries are revalidated with
+  If-None-Match / If-Modified-Since so unchanged pages return HTTP 304
+"""
+
+import sqlite3
+import threading
+import time
+import orjson
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+class URLCache:
+    """Persistent URL -> extracted content cache with LRU eviction"""
+
+    def __init__(self, cache_file, max_entries=5000, max_age_seconds=24 * 60 * 60):
+        self.cache_file = Path(cache_file)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        
+        self._lock = threading.Lock()
+        self._conn = None  # Opened on first use
+
+    def _connection(self):
+        """Open the cache database on first use (caller must hold _lock)"""
+        if self._conn is None:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS url_cache ("
+                "url TEXT PRIMARY KEY, "
+                "content BLOB NOT NULL, "
+                "etag TEXT, "
+                "last_modified TEXT, "
+                "fetched_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS url_cache_accessed ON url_cache (accessed_at)"
+            )
+            self._conn.commit()
+        
+        return self._conn
+
+    def get(self, url):
+        """Look up a cached entry, marking it as recently used"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT content, etag, last_modified, fetched_at FROM url_cache WHERE url = ?",
+                    (url,)
+                ).fetchone()
+                
+                if row is None:
+                    return None
+                
+                now = time.time()
+                conn.execute("UPDATE url_cache SET accessed_at = ? WHERE url = ?", (now, url))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"URL cache lookup failed for {url}: {e}")
+            return None
+        
+        content, etag, last_modified, fetched_at = row
+        return {
+            'content_data': orjson.loads(content),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': now - fetched_at < self.max_age_seconds
+        }
+
+    def set(self, url, content_data, etag=None, last_modified=None):
+        """Store extracted content, evicting least-recently-used entries"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO url_cache "
+                    "(url, content, etag, last_modified, fetched_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, orjson.dumps(content_data), etag, last_modified, now, now)
+                )
+                
+                excess = conn.execute("SELECT COUNT(*) FROM url_cache").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM url_cache WHERE url IN "
+                        "(SELECT url FROM url_cache ORDER BY accessed_at ASC LIMIT ?)",
+                        (excess,)
+                    )
+                
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"URL cache store failed for {url}: {e}")
+
+    def touch(self, url):
+        """Mark an entry as freshly validated (e.g. after HTTP 304)"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                now = time.time()
+                conn.execute(
+                    "UPDATE url_cache SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                    (now, now, url)
+                )
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"URL cache refresh failed for {url}: {e}")
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -11,10 +11,17 @@ This component provides output configuration functionality including:
 
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog
 from pathlib import Path
 from typing import Callable, Optional, List
+import inspect
+import logging
 import os
+import threading
+import time
+import weakref
+
+logger = logging.getLogger(__name__)
 
 
 class OutputPanel(ctk.CTkFrame):
@@ -29,11 +36,69 @@ class OutputPanel(ctk.CTkFrame):
     - Real-time validation feedback
     """
     
+    # Built-in categories, always listed first in the category menu
+    DEFAULT_CATEGORIES = ["General", "Active_Directory", "DNS", "DHCP", "PowerShell", "Security", "Networking"]
+    
+    # Description shown under the category menu
+    CATEGORY_DESCRIPTIONS = {
+        "General": "General purpose training data generation",
+        "Active_Directory": "Active Directory administration and management",
+        "DNS": "Domain Name System configuration and troubleshooting",
+        "DHCP": "Dynamic Host Configuration Protocol management",
+        "PowerShell": "PowerShell scripting and automation",
+        "Security": "Windows Server security and authentication",
+        "Networking": "Network configuration and management"
+    }
+    
+    # Typing pause before an entry is validated, saved and broadcast
+    VALIDATION_DELAY_MS = 250
+    
+    # How long the inline validation summary stays visible
+    SUMMARY_DISPLAY_MS = 4000
+    
+    # Delay before saved-folder checks run at startup (lets the panel paint first)
+    FS_LOAD_DELAY_MS = 50
+    
+    # How long a folder existence check is reused before hitting the disk again
+    FOLDER_CHECK_TTL_SECONDS = 2.0
+    
     def __init__(self, parent, settings_manager=None, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.settings_manager = settings_manager
-        self.change_callbacks = []
+        self.change_callbacks = []  # Callback references (see add_change_callback)
+        self._pending_jobs = {}  # Debounced validation jobs by field
+        self._last_notified = {}  # Last value broadcast per setting
+        self._failed_callbacks = set()  # Listeners whose error was already logged
+        
+        # Folder shortcuts, resolved once
+        self._home = Path.home()
+        self._quick_targets = {
+            "Desktop": self._home / "Desktop" / "MSLearn_Output",
+            "Documents": self._home / "Documents" / "MSLearn_Output",
+            "Default": Path.cwd() / "output"
+        }
+        self._folder_exists_cache = None  # (path, checked_at, exists)
+        self._writable_cache = {}  # Folders that passed the write probe
+        self._last_validated_folder = None  # (path, result) of the last passing validation
+        self._last_category = None  # Skips re-selecting the current category
+        self._preview_cache = None  # (category, training file, metadata file) on display
+        self._ready_cache = None  # (inputs, checked_at, result) of is_ready_for_processing
+        
+        # Last valid parsed entry values (None while an entry is invalid)
+        self._quality_valid: Optional[int] = 100
+        self._delay_valid: Optional[float] = 2.0
+        
+        # Parsed advanced limits (fall back to the defaults while invalid)
+        self._max_content_valid = 6000
+        self._min_content_valid = 300
+        
+        # Shared fonts - one Tk font object per style instead of one per widget
+        self._f_title = ctk.CTkFont(size=16, weight="bold")
+        self._f_section = ctk.CTkFont(size=14, weight="bold")
+        self._f_body = ctk.CTkFont(size=12)
+        self._f_status_small = ctk.CTkFont(size=11)
+        self._f_small = ctk.CTkFont(size=10)
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -53,7 +118,7 @@ class OutputPanel(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.header_frame,
             text="Output & Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._f_title
         )
         self.title_label.grid(row=0, column=0, sticky="w", padx=10, pady=10)
         
@@ -61,7 +126,7 @@ class OutputPanel(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self.header_frame,
             text="✓ Ready",
-            font=ctk.CTkFont(size=12),
+            font=self._f_body,
             text_color="green"
         )
         self.status_label.grid(row=0, column=1, sticky="e", padx=10, pady=10)
@@ -89,7 +154,7 @@ class OutputPanel(ctk.CTkFrame):
         folder_title = ctk.CTkLabel(
             self.output_frame,
             text="📁 Output Folder",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f_section
         )
         folder_title.grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
         
@@ -97,7 +162,7 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.output_frame,
             text="Output Directory:",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         ).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         # Folder path entry
@@ -128,7 +193,7 @@ class OutputPanel(ctk.CTkFrame):
         self.folder_status_label = ctk.CTkLabel(
             self.folder_status_frame,
             text="",
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         )
         self.folder_status_label.pack(padx=10, pady=5)
         
@@ -139,7 +204,7 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.quick_folders_frame,
             text="Quick Options:",
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         ).pack(side="left", padx=(10, 5), pady=5)
         
         # Desktop button
@@ -149,7 +214,7 @@ class OutputPanel(ctk.CTkFrame):
             command=lambda: self._set_quick_folder("Desktop"),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         )
         self.desktop_btn.pack(side="left", padx=2, pady=5)
         
@@ -160,7 +225,7 @@ class OutputPanel(ctk.CTkFrame):
             command=lambda: self._set_quick_folder("Documents"),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         )
         self.documents_btn.pack(side="left", padx=2, pady=5)
         
@@ -171,7 +236,7 @@ class OutputPanel(ctk.CTkFrame):
             command=lambda: self._set_quick_folder("Default"),
             width=80,
             height=25,
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         )
         self.default_btn.pack(side="left", padx=2, pady=5)
         
@@ -186,7 +251,7 @@ class OutputPanel(ctk.CTkFrame):
         category_title = ctk.CTkLabel(
             self.category_frame,
             text="🏷️ Category Selection",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f_section
         )
         category_title.grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
         
@@ -194,7 +259,7 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.category_frame,
             text="Category Name:",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         ).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         # Category dropdown
@@ -202,7 +267,7 @@ class OutputPanel(ctk.CTkFrame):
         self.category_menu = ctk.CTkOptionMenu(
             self.category_frame,
             variable=self.category_var,
-            values=["General", "Active_Directory", "DNS", "DHCP", "PowerShell", "Security", "Networking"],
+            values=list(self.DEFAULT_CATEGORIES),
             command=self._on_category_change
         )
         self.category_menu.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
@@ -224,7 +289,7 @@ class OutputPanel(ctk.CTkFrame):
         self.category_desc_label = ctk.CTkLabel(
             self.category_desc_frame,
             text="General purpose training data generation",
-            font=ctk.CTkFont(size=10),
+            font=self._f_small,
             text_color="gray"
         )
         self.category_desc_label.pack(padx=10, pady=5)
@@ -240,7 +305,7 @@ class OutputPanel(ctk.CTkFrame):
         settings_title = ctk.CTkLabel(
             self.settings_frame,
             text="⚙️ Processing Settings",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f_section
         )
         settings_title.grid(row=0, column=0, columnspan=4, sticky="w", padx=10, pady=(10, 5))
         
@@ -248,7 +313,7 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.settings_frame,
             text="Quality Threshold:",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         ).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         self.quality_var = tk.StringVar(value="100")
@@ -265,7 +330,7 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.settings_frame,
             text="Processing Delay:",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         ).grid(row=1, column=2, sticky="w", padx=(20, 5), pady=5)
         
         delay_frame = ctk.CTkFrame(self.settings_frame)
@@ -284,7 +349,7 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             delay_frame,
             text="seconds",
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         ).pack(side="left", padx=(0, 5))
         
         # Advanced settings toggle
@@ -297,18 +362,23 @@ class OutputPanel(ctk.CTkFrame):
         )
         self.advanced_checkbox.grid(row=2, column=0, columnspan=2, sticky="w", padx=10, pady=5)
         
-        # Advanced settings frame (initially hidden)
+        # Advanced settings values exist up front; their widgets are built
+        # the first time the section is shown (see _build_advanced_frame)
+        self.max_content_var = tk.StringVar(value="6000")
+        self.min_content_var = tk.StringVar(value="300")
+        self.advanced_frame = None
+        
+    def _build_advanced_frame(self):
+        """Create the advanced settings widgets on first use"""
         self.advanced_frame = ctk.CTkFrame(self.settings_frame)
-        # Will be shown/hidden based on checkbox
         
         # Content length limits
         ctk.CTkLabel(
             self.advanced_frame,
             text="Max Content Length:",
-            font=ctk.CTkFont(size=11)
+            font=self._f_status_small
         ).grid(row=0, column=0, sticky="w", padx=10, pady=2)
         
-        self.max_content_var = tk.StringVar(value="6000")
         self.max_content_entry = ctk.CTkEntry(
             self.advanced_frame,
             textvariable=self.max_content_var,
@@ -316,21 +386,21 @@ class OutputPanel(ctk.CTkFrame):
             height=28
         )
         self.max_content_entry.grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        self.max_content_entry.bind("<KeyRelease>", self._validate_max_content)
         
         ctk.CTkLabel(
             self.advanced_frame,
             text="characters",
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         ).grid(row=0, column=2, sticky="w", padx=5, pady=2)
         
         # Min content length
         ctk.CTkLabel(
             self.advanced_frame,
             text="Min Content Length:",
-            font=ctk.CTkFont(size=11)
+            font=self._f_status_small
         ).grid(row=1, column=0, sticky="w", padx=10, pady=2)
         
-        self.min_content_var = tk.StringVar(value="300")
         self.min_content_entry = ctk.CTkEntry(
             self.advanced_frame,
             textvariable=self.min_content_var,
@@ -338,11 +408,12 @@ class OutputPanel(ctk.CTkFrame):
             height=28
         )
         self.min_content_entry.grid(row=1, column=1, sticky="w", padx=5, pady=2)
+        self.min_content_entry.bind("<KeyRelease>", self._validate_min_content)
         
         ctk.CTkLabel(
             self.advanced_frame,
             text="characters",
-            font=ctk.CTkFont(size=10)
+            font=self._f_small
         ).grid(row=1, column=2, sticky="w", padx=5, pady=2)
         
     def _create_preview_section(self):
@@ -356,7 +427,7 @@ class OutputPanel(ctk.CTkFrame):
         preview_title = ctk.CTkLabel(
             self.preview_frame,
             text="👁️ Output Preview",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._f_section
         )
         preview_title.grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
         
@@ -364,13 +435,13 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.preview_frame,
             text="Training Data File:",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         ).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         self.filename_label = ctk.CTkLabel(
             self.preview_frame,
             text="general_training_data.jsonl",
-            font=ctk.CTkFont(size=11),
+            font=self._f_status_small,
             text_color="gray"
         )
         self.filename_label.grid(row=1, column=1, sticky="w", padx=5, pady=5)
@@ -379,13 +450,13 @@ class OutputPanel(ctk.CTkFrame):
         ctk.CTkLabel(
             self.preview_frame,
             text="Metadata File:",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         ).grid(row=2, column=0, sticky="w", padx=10, pady=5)
         
         self.metadata_label = ctk.CTkLabel(
             self.preview_frame,
             text="general_metadata.json",
-            font=ctk.CTkFont(size=11),
+            font=self._f_status_small,
             text_color="gray"
         )
         self.metadata_label.grid(row=2, column=1, sticky="w", padx=5, pady=5)
@@ -400,12 +471,21 @@ class OutputPanel(ctk.CTkFrame):
         )
         self.validate_btn.grid(row=1, column=2, rowspan=2, padx=(10, 10), pady=5)
         
+        # Inline validation result (replaces blocking message boxes)
+        self.validation_summary_label = ctk.CTkLabel(
+            self.preview_frame,
+            text="",
+            font=self._f_status_small,
+            justify="left"
+        )
+        self.validation_summary_label.grid(row=3, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 5))
+        
         # Initialize with current values
         self._update_filename_preview()
         
     def _browse_output_folder(self):
         """Open folder browser dialog"""
-        initial_dir = self.folder_var.get() or str(Path.home())
+        initial_dir = self.folder_var.get() or str(self._home)
         
         folder = filedialog.askdirectory(
             title="Select Output Folder",
@@ -413,32 +493,37 @@ class OutputPanel(ctk.CTkFrame):
         )
         
         if folder:
+            self._forget_folder_checks(folder)
             self.folder_var.set(folder)
             self._validate_output_folder()
-            self._update_filename_preview()
             self._save_setting("default_output_dir", folder)
             self._notify_change("output_folder", folder)
     
     def _set_quick_folder(self, folder_type):
         """Set quick folder option"""
-        if folder_type == "Desktop":
-            folder = str(Path.home() / "Desktop" / "MSLearn_Output")
-        elif folder_type == "Documents":
-            folder = str(Path.home() / "Documents" / "MSLearn_Output")
-        elif folder_type == "Default":
-            folder = str(Path.cwd() / "output")
-        
-        # Create folder if it doesn't exist
-        Path(folder).mkdir(parents=True, exist_ok=True)
+        folder = str(self._quick_targets[folder_type])
         
+        # Folder is created (if missing) by the background validation
+        self._forget_folder_checks(folder)
         self.folder_var.set(folder)
         self._validate_output_folder()
-        self._update_filename_preview()
         self._save_setting("default_output_dir", folder)
         self._notify_change("output_folder", folder)
     
-    def _validate_output_folder(self):
-        """Validate the selected output folder"""
+    def _forget_folder_checks(self, folder):
+        """Drop cached checks so an explicitly chosen folder is re-examined"""
+        self._folder_exists_cache = None
+        self._writable_cache.pop(folder, None)
+        self._ready_cache = None
+        self._last_validated_folder = None
+    
+    def _validate_output_folder(self, on_done: Optional[Callable[[bool], None]] = None, force: bool = False):
+        """Validate the selected output folder in a background thread
+        
+        The folder is created and write-tested off the UI thread (slow on network
+        or synced drives); on_done receives the result on the main thread.
+        force skips the cached result of the last passing validation.
+        """
         folder_path = self.folder_var.get()
         
         if not folder_path:
@@ -447,43 +532,81 @@ class OutputPanel(ctk.CTkFrame):
                 text_color="orange"
             )
             self.status_label.configure(text="⚠️ Setup Required", text_color="orange")
-            return False
+            if on_done:
+                on_done(False)
+            return
+        
+        # Folder unchanged since it last passed - reuse the result
+        if not force and self._last_validated_folder and self._last_validated_folder[0] == folder_path:
+            self._apply_folder_result(folder_path, self._last_validated_folder[1], on_done)
+            return
+        
+        threading.Thread(
+            target=self._validate_folder_worker,
+            args=(folder_path, on_done),
+            daemon=True
+        ).start()
+    
+    def _validate_folder_worker(self, folder_path, on_done):
+        """Background thread for output folder validation"""
+        result = self._check_output_folder(folder_path)
         
+        # Schedule UI update on main thread
+        self.after(0, self._apply_folder_result, folder_path, result, on_done)
+    
+    def _check_output_folder(self, folder_path):
+        """Create and write-test a folder, returning (valid, message)"""
         path = Path(folder_path)
         
         try:
             if not path.exists():
                 path.mkdir(parents=True, exist_ok=True)
             
-            # Test write permission
-            test_file = path / "test_write.tmp"
-            test_file.write_text("test")
-            test_file.unlink()
+            # Test write permission - os.access rejects obvious cases cheaply,
+            # the probe file is written once per folder
+            if not self._writable_cache.get(folder_path):
+                if not os.access(path, os.W_OK):
+                    raise PermissionError(folder_path)
+                
+                test_file = path / "test_write.tmp"
+                test_file.write_text("test")
+                test_file.unlink()
+                self._writable_cache[folder_path] = True
             
-            self.folder_status_label.configure(
-                text="✓ Folder is valid and writable",
-                text_color="green"
-            )
-            self._update_status()
-            return True
+            return True, "✓ Folder is valid and writable"
             
         except PermissionError:
-            self.folder_status_label.configure(
-                text="❌ Permission denied - cannot write to folder",
-                text_color="red"
-            )
-            self.status_label.configure(text="❌ Invalid Setup", text_color="red")
-            return False
+            return False, "❌ Permission denied - cannot write to folder"
         except Exception as e:
+            return False, f"❌ Error: {str(e)[:50]}..."
+    
+    def _apply_folder_result(self, folder_path, result, on_done):
+        """Show an output folder validation result (main thread)"""
+        valid, message = result
+        
+        # Ignore results for a folder that has since been replaced
+        if folder_path == self.folder_var.get():
             self.folder_status_label.configure(
-                text=f"❌ Error: {str(e)[:50]}...",
-                text_color="red"
+                text=message,
+                text_color="green" if valid else "red"
             )
-            self.status_label.configure(text="❌ Invalid Setup", text_color="red")
-            return False
+            
+            if valid:
+                self._last_validated_folder = (folder_path, result)
+                self._folder_exists_cache = (folder_path, time.monotonic(), True)
+                self._update_status()
+            else:
+                self.status_label.configure(text="❌ Invalid Setup", text_color="red")
+        
+        if on_done:
+            on_done(valid)
     
     def _on_category_change(self, category):
         """Handle category selection change"""
+        if category == self._last_category:
+            return
+        
+        self._last_category = category
         self._update_category_description(category)
         self._update_filename_preview()
         self._save_setting("last_category", category)
@@ -492,18 +615,9 @@ class OutputPanel(ctk.CTkFrame):
     
     def _update_category_description(self, category):
         """Update category description text"""
-        descriptions = {
-            "General": "General purpose training data generation",
-            "Active_Directory": "Active Directory administration and management",
-            "DNS": "Domain Name System configuration and troubleshooting",
-            "DHCP": "Dynamic Host Configuration Protocol management",
-            "PowerShell": "PowerShell scripting and automation",
-            "Security": "Windows Server security and authentication",
-            "Networking": "Network configuration and management"
-        }
-        
-        desc = descriptions.get(category, "Custom training data category")
-        self.category_desc_label.configure(text=desc)
+        desc = self.CATEGORY_DESCRIPTIONS.get(category, "Custom training data category")
+        if desc != self.category_desc_label.cget("text"):
+            self.category_desc_label.configure(text=desc)
     
     def _create_custom_category(self):
         """Create a custom category"""
@@ -518,7 +632,9 @@ class OutputPanel(ctk.CTkFrame):
             # Clean up the category name
             custom_category = custom_category.strip().replace(" ", "_")
             
-            if custom_category:
+            if custom_category and custom_category != self._last_category:
+                self._last_category = custom_category
+                
                 # Add to the option menu
                 current_values = self.category_menu._values
                 if custom_category not in current_values:
@@ -531,59 +647,126 @@ class OutputPanel(ctk.CTkFrame):
                 self._add_recent_category(custom_category)
                 self._notify_change("category", custom_category)
     
+    def _debounce(self, key, func, delay_ms=None):
+        """Run func once typing in a field pauses, cancelling earlier requests"""
+        job = self._pending_jobs.pop(key, None)
+        if job:
+            self.after_cancel(job)
+        
+        if delay_ms is None:
+            delay_ms = self.VALIDATION_DELAY_MS
+        self._pending_jobs[key] = self.after(delay_ms, self._run_pending, key, func)
+    
+    def _run_pending(self, key, func):
+        """Run a debounced job and forget its id"""
+        self._pending_jobs.pop(key, None)
+        func()
+    
     def _validate_quality_threshold(self, event=None):
+        """Schedule quality threshold validation"""
+        self._debounce("quality", self._do_validate_quality)
+    
+    def _do_validate_quality(self):
         """Validate quality threshold input"""
-        try:
-            value = int(self.quality_var.get())
-            if value < 0 or value > 1000:
-                raise ValueError("Out of range")
-            
+        value = self._parse_number(self.quality_var.get(), int, 0, 1000)
+        self._quality_valid = value
+        
+        if value is not None:
             self.quality_entry.configure(border_color=("gray60", "gray40"))
             self._save_setting("quality_threshold", value)
             self._notify_change("quality_threshold", value)
             self._update_status()
-            
-        except ValueError:
+        else:
             self.quality_entry.configure(border_color="red")
     
     def _validate_delay(self, event=None):
+        """Schedule processing delay validation"""
+        self._debounce("delay", self._do_validate_delay)
+    
+    def _do_validate_delay(self):
         """Validate processing delay input"""
-        try:
-            value = float(self.delay_var.get())
-            if value < 0.5 or value > 60:
-                raise ValueError("Out of range")
-            
+        value = self._parse_number(self.delay_var.get(), float, 0.5, 60)
+        self._delay_valid = value
+        
+        if value is not None:
             self.delay_entry.configure(border_color=("gray60", "gray40"))
             self._save_setting("delay_seconds", value)
             self._notify_change("delay_seconds", value)
             self._update_status()
-            
-        except ValueError:
+        else:
             self.delay_entry.configure(border_color="red")
     
+    def _validate_max_content(self, event=None):
+        """Parse max content length input"""
+        value = self._parse_content_length(self.max_content_var.get())
+        self._max_content_valid = value if value is not None else 6000
+        
+        if self.advanced_frame is not None:
+            self.max_content_entry.configure(border_color=("gray60", "gray40") if value is not None else "red")
+    
+    def _validate_min_content(self, event=None):
+        """Parse min content length input"""
+        value = self._parse_content_length(self.min_content_var.get())
+        self._min_content_valid = value if value is not None else 300
+        
+        if self.advanced_frame is not None:
+            self.min_content_entry.configure(border_color=("gray60", "gray40") if value is not None else "red")
+    
+    @staticmethod
+    def _parse_content_length(text):
+        """Parse a content length entry (digits only), returning None if invalid"""
+        return int(text) if text.isdecimal() else None
+    
+    @staticmethod
+    def _parse_number(text, number_type, minimum, maximum):
+        """Parse an entry value, returning None if it is invalid or out of range"""
+        try:
+            value = number_type(text)
+        except ValueError:
+            return None
+        
+        return value if minimum <= value <= maximum else None
+    
     def _toggle_advanced_settings(self):
         """Toggle advanced settings visibility"""
         if self.advanced_var.get():
+            if self.advanced_frame is None:
+                self._build_advanced_frame()
             self.advanced_frame.grid(row=3, column=0, columnspan=4, sticky="ew", padx=10, pady=5)
-        else:
+        elif self.advanced_frame is not None:
             self.advanced_frame.grid_remove()
     
     def _update_filename_preview(self):
         """Update the filename preview based on current settings"""
-        category = self.category_var.get().lower()
+        category = self.category_var.get()
+        if self._preview_cache and self._preview_cache[0] == category:
+            return
         
-        training_filename = f"{category}_training_data.jsonl"
-        metadata_filename = f"{category}_metadata.json"
+        name = category.lower()
+        training_filename = f"{name}_training_data.jsonl"
+        metadata_filename = f"{name}_metadata.json"
         
-        self.filename_label.configure(text=training_filename)
-        self.metadata_label.configure(text=metadata_filename)
+        # Only touch the labels whose text actually changes
+        previous = self._preview_cache or (None, None, None)
+        if training_filename != previous[1]:
+            self.filename_label.configure(text=training_filename)
+        if metadata_filename != previous[2]:
+            self.metadata_label.configure(text=metadata_filename)
+        
+        self._preview_cache = (category, training_filename, metadata_filename)
     
     def _validate_settings(self):
         """Validate all current settings"""
+        # Output folder is checked in the background; report once it is done.
+        # An explicit validation always re-checks the folder on disk.
+        self._validate_output_folder(on_done=self._report_settings_validation, force=True)
+    
+    def _report_settings_validation(self, folder_valid):
+        """Check the remaining settings and report all issues"""
         issues = []
         
         # Validate output folder
-        if not self._validate_output_folder():
+        if not folder_valid:
             issues.append("Invalid output folder")
         
         # Validate quality threshold
@@ -603,32 +786,45 @@ class OutputPanel(ctk.CTkFrame):
             issues.append("Invalid processing delay")
         
         if issues:
-            messagebox.showwarning(
-                "Settings Validation",
-                "Issues found:\\n• " + "\\n• ".join(issues)
+            self.validation_summary_label.configure(
+                text="\n".join(["⚠️ Issues found:", *(f"• {issue}" for issue in issues)]),
+                text_color="orange"
             )
         else:
-            messagebox.showinfo(
-                "Settings Validation",
-                "✓ All settings are valid and ready for processing!"
+            self.validation_summary_label.configure(
+                text="✓ All settings are valid and ready for processing!",
+                text_color="green"
             )
             self._update_status()
+        
+        # Clear the summary after a while (restarted by each validation)
+        self._debounce(
+            "summary",
+            lambda: self.validation_summary_label.configure(text=""),
+            self.SUMMARY_DISPLAY_MS
+        )
+    
+    def _folder_exists(self, folder):
+        """Check whether a folder exists, reusing a recent result for the same path"""
+        now = time.monotonic()
+        cached = self._folder_exists_cache
+        if cached and cached[0] == folder and now - cached[1] < self.FOLDER_CHECK_TTL_SECONDS:
+            return cached[2]
+        
+        exists = Path(folder).exists()
+        self._folder_exists_cache = (folder, now, exists)
+        return exists
     
     def _update_status(self):
         """Update the overall status indicator"""
         # Check if all required settings are valid
-        has_folder = bool(self.folder_var.get())
-        folder_valid = has_folder and Path(self.folder_var.get()).exists()
-        
-        try:
-            quality_valid = 0 <= int(self.quality_var.get()) <= 1000
-        except ValueError:
-            quality_valid = False
+        folder = self.folder_var.get()
+        has_folder = bool(folder)
+        folder_valid = has_folder and self._folder_exists(folder)
         
-        try:
-            delay_valid = 0.5 <= float(self.delay_var.get()) <= 60
-        except ValueError:
-            delay_valid = False
+        # Entry values are parsed once by their validators
+        quality_valid = self._quality_valid is not None
+        delay_valid = self._delay_valid is not None
         
         if folder_valid and quality_valid and delay_valid:
             self.status_label.configure(text="✓ Ready", text_color="green")
@@ -638,84 +834,126 @@ class OutputPanel(ctk.CTkFrame):
             self.status_label.configure(text="❌ Setup Required", text_color="red")
     
     def _load_settings(self):
-        """Load settings from settings manager"""
+        """Load settings from settings manager
+        
+        Widget values are filled in right away; folder checks touch the disk
+        and are deferred until the panel has had a chance to paint.
+        """
         if not self.settings_manager:
             return
         
+        self._load_ui_state()
+        self.after(self.FS_LOAD_DELAY_MS, self._load_fs_state)
+    
+    def _load_ui_state(self):
+        """Fill widgets from saved settings (no filesystem access)"""
         # Load output folder
         output_dir = self.settings_manager.get("default_output_dir", "")
         if output_dir:
             self.folder_var.set(output_dir)
-            self._validate_output_folder()
         
         # Load category
         category = self.settings_manager.get("last_category", "General")
         self.category_var.set(category)
+        self._last_category = category
         self._update_category_description(category)
         
         # Load processing settings
         quality = self.settings_manager.get("quality_threshold", 100)
         self.quality_var.set(str(quality))
+        self._quality_valid = self._parse_number(str(quality), int, 0, 1000)
         
         delay = self.settings_manager.get("delay_seconds", 2)
         self.delay_var.set(str(delay))
+        self._delay_valid = self._parse_number(str(delay), float, 0.5, 60)
         
         # Load advanced settings
         max_content = self.settings_manager.get("max_content_length", 6000)
         self.max_content_var.set(str(max_content))
+        self._validate_max_content()
         
         min_content = self.settings_manager.get("min_content_length", 300)
         self.min_content_var.set(str(min_content))
+        self._validate_min_content()
         
         # Load recent categories for dropdown
         recent_categories = self.settings_manager.get("recent_categories", [])
         if recent_categories:
-            all_categories = list(set(
-                ["General", "Active_Directory", "DNS", "DHCP", "PowerShell", "Security", "Networking"] + 
-                recent_categories
-            ))
-            self.category_menu.configure(values=all_categories)
+            # Order-preserving de-duplication keeps the menu stable between launches
+            all_categories = list(dict.fromkeys(self.DEFAULT_CATEGORIES + recent_categories))
+            if all_categories != self.category_menu._values:
+                self.category_menu.configure(values=all_categories)
         
         self._update_filename_preview()
+    
+    def _load_fs_state(self):
+        """Validate the saved output folder and refresh the status indicator"""
+        if self.folder_var.get():
+            self._validate_output_folder()
         self._update_status()
     
     def _save_setting(self, key, value):
         """Save a setting to the settings manager"""
         if self.settings_manager:
+            # Settings coalesces a burst of set() calls into one deferred write
             self.settings_manager.set(key, value)
-            self.settings_manager.save()
     
     def _add_recent_category(self, category):
         """Add category to recent categories list"""
         if not self.settings_manager:
             return
         
-        recent = self.settings_manager.get("recent_categories", [])
-        
-        # Remove if exists (to move to front)
-        if category in recent:
-            recent.remove(category)
-        
-        # Add to front
-        recent.insert(0, category)
-        
-        # Keep only last 10
-        recent = recent[:10]
-        
-        self.settings_manager.set("recent_categories", recent)
-        self.settings_manager.save()
+        # Settings keeps the bounded most-recent-first list
+        self.settings_manager.add_recent_category(category, max_items=10)
     
     def _notify_change(self, setting_name, value):
         """Notify listeners of setting changes"""
-        for callback in self.change_callbacks:
+        # Listeners only hear about values that actually changed
+        if setting_name in self._last_notified and self._last_notified[setting_name] == value:
+            return
+        self._last_notified[setting_name] = value
+        
+        alive = []
+        for callback_ref in self.change_callbacks:
+            callback = callback_ref()
+            if callback is None:
+                # Owner was garbage collected - drop the listener
+                self._failed_callbacks.discard(id(callback_ref))
+                continue
+            alive.append(callback_ref)
+            
             try:
                 callback(setting_name, value)
             except Exception as e:
-                print(f"Error in change callback: {e}")
+                # Log each failing listener once instead of on every change
+                if id(callback_ref) not in self._failed_callbacks:
+                    self._failed_callbacks.add(id(callback_ref))
+                    logger.warning(f"Error in change callback {callback!r}: {e}")
+        
+        self.change_callbacks = alive
     
     def add_change_callback(self, callback: Callable):
-        """Add callback for setting changes"""
-        self.change_callbacks.append(callback)
+        """Add callback for setting changes
+        
+        Bound methods are held weakly so a listener does not keep its owner
+        alive; plain functions and lambdas are kept as-is.
+        """
+        if inspect.ismethod(callback):
+            callback_ref = weakref.WeakMethod(callback)
+        else:
+            callback_ref = lambda callback=callback: callback
+        
+        self.change_callbacks.append(callback_ref)
+    
+    def destroy(self):
+        """Cancel pending validation jobs and write deferred settings before destroying the panel"""
+        for job in self._pending_jobs.values():
+            self.after_cancel(job)
+        self._pending_jobs.clear()
+        if self.settings_manager:
+            self.settings_manager.flush()
+        
+        super().destroy()
     
     def get_output_folder(self) -> str:
         """Get current output folder"""
@@ -746,19 +984,30 @@ class OutputPanel(ctk.CTkFrame):
             "category": self.get_category(),
             "quality_threshold": self.get_quality_threshold(),
             "delay_seconds": self.get_delay_seconds(),
-            "max_content_length": int(self.max_content_var.get()) if self.max_content_var.get().isdigit() else 6000,
-            "min_content_length": int(self.min_content_var.get()) if self.min_content_var.get().isdigit() else 300
+            "max_content_length": self._max_content_valid,
+            "min_content_length": self._min_content_valid
         }
     
     def is_ready_for_processing(self) -> bool:
         """Check if settings are ready for processing"""
+        # Reuse the last answer while its inputs are unchanged; the folder's
+        # existence is re-checked after the usual folder-check TTL
         folder = self.get_output_folder()
-        return (
-            folder and 
-            Path(folder).exists() and
-            0 <= self.get_quality_threshold() <= 1000 and
-            0.5 <= self.get_delay_seconds() <= 60
+        inputs = (folder, self._quality_valid is not None, self._delay_valid is not None)
+        now = time.monotonic()
+        
+        cached = self._ready_cache
+        if cached is not None and cached[0] == inputs and now - cached[1] < self.FOLDER_CHECK_TTL_SECONDS:
+            return cached[2]
+        
+        result = bool(
+            folder and
+            self._folder_exists(folder) and
+            inputs[1] and
+            inputs[2]
         )
+        self._ready_cache = (inputs, now, result)
+        return result
 
 
 # Test the component if run directly
@@ -9,22 +9,93 @@ This component provides URL management functionality including:
 """
 
 import customtkinter as ctk
-from typing import List, Callable, Optional
+from typing import List, Callable, Iterable, Iterator, Optional
 import threading
-from urllib.parse import urlparse
+import queue
+import functools
 import re
+import uuid
+from urllib.parse import urlsplit
+from collections import Counter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+
+# MS Learn article URL: http(s) scheme, learn.microsoft.com host (optionally a
+# subdomain or port) and a non-empty path - compiled once at import
+_MSLEARN_RE = re.compile(
+    r'https?://(?:[\w.-]+\.)?learn\.microsoft\.com(?::\d+)?/[^\s/?#]',
+    re.IGNORECASE | re.ASCII
+)
+_MSLEARN_HOST = 'learn.microsoft.com'
+
+# Status indicator colors, shared by the legend and every URL row
+_STATUS_COLORS = MappingProxyType({
+    "ready": "#1f538d",       # Blue
+    "processing": "#f59e0b",  # Yellow/Orange
+    "completed": "#059669",   # Green
+    "failed": "#dc2626",      # Red
+    "invalid": "#6b7280"      # Gray
+})
+_DEFAULT_STATUS_COLOR = "#6b7280"
+
+
+def _match_mslearn(url: str) -> bool:
+    """Check a URL against the MS Learn pattern, skipping the regex for other sites"""
+    # Without capitals a match must contain the host verbatim; both checks are
+    # single C-level scans with no copy. Mixed-case URLs go to the full pattern.
+    if _MSLEARN_HOST not in url and url.islower():
+        return False
+    return _MSLEARN_RE.match(url) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_mslearn(url: str) -> bool:
+    """Check a URL against the MS Learn pattern (memoized - lists are re-validated often)"""
+    return _match_mslearn(url)
+
+
+def _validate_batch(urls: List[str]) -> List[bool]:
+    """Check a whole list against the MS Learn pattern in one pass (not memoized)"""
+    return list(map(_match_mslearn, urls))
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonicalize(url: str) -> str:
+    """Duplicate-detection key: lowercase scheme/host, no trailing slash or fragment"""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:  # Malformed URL (e.g. unbalanced IPv6 brackets) - keep it as typed
+        return url.strip()
+    canonical = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    if parts.query:
+        canonical += f"?{parts.query}"
+    return canonical
 
 
 class URLItem:
     """Represents a single URL with its status and metadata"""
     
+    __slots__ = (
+        "id", "url", "canonical", "display_url", "status", "title", "category", "error_message",
+        "row_frame", "status_indicator", "info_label"
+    )
+    
     def __init__(self, url: str):
+        self.id = uuid.uuid4().hex  # Stable identity for widget callbacks
         self.url = url
+        self.canonical = _canonicalize(url)
+        self.display_url = url if len(url) <= 80 else url[:77] + "..."  # Truncated once for the row label
         self.status = "ready"  # ready, processing, completed, failed, invalid
         self.title = ""
         self.category = ""
         self.error_message = ""
         
+        # Row widgets displaying this item (set while the row exists)
+        self.row_frame = None
+        self.status_indicator = None
+        self.info_label = None
+        
     def __str__(self):
         return f"{self.url} ({self.status})"
 
@@ -41,19 +112,47 @@ class URLManager(ctk.CTkFrame):
     - Integration with backend generator
     """
     
+    # Status updates are queued and applied together every UPDATE_POLL_MS,
+    # at most UPDATE_DRAIN_LIMIT per poll so a burst can't stall the UI
+    UPDATE_POLL_MS = 20
+    UPDATE_DRAIN_LIMIT = 200
+    VALIDATION_WORKERS = 8  # Max concurrent categorize_url calls
+    
+    # Only rows in view (plus an over-scan margin) get widgets; all rows share
+    # a fixed height so positions follow from list indices
+    ROW_HEIGHT = 40
+    ROW_OVERSCAN = 5
+    
     def __init__(self, parent, backend_generator=None, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.backend_generator = backend_generator
         self.url_items: List[URLItem] = []
+        self._url_index = {}  # Canonical URL -> URLItem, for O(1) duplicate checks and lookups
+        self._status_counts = Counter()  # Items per status, kept up to date by _set_status
+        self._items_by_id = {}  # URLItem.id -> URLItem
+        self._visible_rows = {}  # URLItem.id -> list index of rows that have widgets
+        self._render_scheduled = False
+        
+        # Status updates waiting to be applied (see update_url_status)
+        self._update_q = queue.Queue()
+        self._drain_after_id = None
         self.validation_callbacks = []
         self.status_change_callbacks = []
         
+        # Shared fonts - one Tk font object per style instead of one per widget
+        self._f_title = ctk.CTkFont(size=16, weight="bold")
+        self._f_indicator = ctk.CTkFont(size=14)
+        self._f_body = ctk.CTkFont(size=12)
+        self._f_url = ctk.CTkFont(size=11)
+        self._f_small = ctk.CTkFont(size=10)
+        
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
         self._setup_ui()
+        self._drain_after_id = self.after(self.UPDATE_POLL_MS, self._drain_updates)
         
     def _setup_ui(self):
         """Setup the URL manager UI components"""
@@ -67,7 +166,7 @@ class URLManager(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.header_frame,
             text="URL Management",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._f_title
         )
         self.title_label.grid(row=0, column=0, sticky="w", padx=10, pady=10)
         
@@ -75,7 +174,7 @@ class URLManager(ctk.CTkFrame):
         self.counter_label = ctk.CTkLabel(
             self.header_frame,
             text="0 URLs",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         )
         self.counter_label.grid(row=0, column=1, sticky="e", padx=10, pady=10)
         
@@ -116,6 +215,25 @@ class URLManager(ctk.CTkFrame):
         self.scrollable_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
         
+        # Spacer sized to the whole list keeps the scrollbar geometry right
+        # while rows are placed over it at index * ROW_HEIGHT
+        self.rows_spacer = ctk.CTkFrame(
+            self.scrollable_frame,
+            height=1,
+            fg_color="transparent"
+        )
+        self.rows_spacer.grid(row=0, column=0, sticky="ew")
+        
+        # Re-render whenever the view moves (scrollbar, mouse wheel, resize)
+        canvas = self.scrollable_frame._parent_canvas
+        scrollbar_set = canvas.cget("yscrollcommand")
+        
+        def on_scroll(first, last):
+            canvas.tk.call(scrollbar_set, first, last)
+            self._schedule_render()
+        
+        canvas.configure(yscrollcommand=on_scroll)
+        
         # Control buttons
         self.controls_frame = ctk.CTkFrame(self)
         self.controls_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=(5, 10))
@@ -154,28 +272,20 @@ class URLManager(ctk.CTkFrame):
         self.legend_frame.grid(row=0, column=3, sticky="e", padx=(20, 10), pady=10)
         
         # Status indicators legend
-        status_colors = {
-            "Ready": "#1f538d",      # Blue
-            "Processing": "#f59e0b", # Yellow/Orange  
-            "Completed": "#059669",  # Green
-            "Failed": "#dc2626",     # Red
-            "Invalid": "#6b7280"     # Gray
-        }
-        
         legend_col = 0
-        for status, color in status_colors.items():
+        for status, color in _STATUS_COLORS.items():
             indicator = ctk.CTkLabel(
                 self.legend_frame,
                 text="●",
-                font=ctk.CTkFont(size=12),
+                font=self._f_body,
                 text_color=color
             )
             indicator.grid(row=0, column=legend_col, padx=(5, 2), pady=5)
             
             label = ctk.CTkLabel(
                 self.legend_frame,
-                text=status,
-                font=ctk.CTkFont(size=10)
+                text=status.capitalize(),
+                font=self._f_small
             )
             label.grid(row=0, column=legend_col + 1, padx=(0, 10), pady=5)
             legend_col += 2
@@ -200,34 +310,94 @@ class URLManager(ctk.CTkFrame):
         Returns:
             True if URL was added, False if duplicate or invalid
         """
-        # Check for duplicates
-        if any(item.url == url for item in self.url_items):
+        if not self._append_item(url):
             return False
+        
+        self._resize_spacer()
+        self._schedule_render()
+        self._update_counter()
+        
+        return True
+    
+    def add_url_many(self, urls: Iterable[str]) -> int:
+        """
+        Add many URLs with a single list render and status notification
+        
+        Args:
+            urls: URLs to add
             
+        Returns:
+            Number of URLs added (duplicates are skipped)
+        """
+        urls = list(urls)
+        
+        # Format-check the whole chunk at once; loaded lists are mostly new URLs,
+        # which would only churn the add_url memo
+        added = sum(
+            1 for url, valid in zip(urls, _validate_batch(urls))
+            if self._append_item(url, valid)
+        )
+        
+        if added:
+            self._resize_spacer()
+            self._schedule_render()
+            self._update_counter()
+        
+        return added
+    
+    def _append_item(self, url: str, valid: Optional[bool] = None) -> bool:
+        """Add a URL to the model only (no rendering); False if duplicate
+        
+        valid is the URL's format check when the caller already ran it.
+        """
         # Create URL item
         url_item = URLItem(url)
         
+        # Check for duplicates (ignoring case of scheme/host and trailing slashes)
+        if url_item.canonical in self._url_index:
+            return False
+        
         # Basic validation
-        if not self._is_valid_mslearn_url(url):
+        if valid is None:
+            valid = _validate_mslearn(url)
+        if not valid:
             url_item.status = "invalid"
             url_item.error_message = "Not a valid MS Learn URL"
         
+        self._status_counts[url_item.status] += 1
         self.url_items.append(url_item)
-        self._create_url_widget(url_item, len(self.url_items) - 1)
-        self._update_counter()
+        self._url_index[url_item.canonical] = url_item
+        self._items_by_id[url_item.id] = url_item
         
         return True
     
     def remove_url(self, index: int):
         """Remove URL at specific index"""
         if 0 <= index < len(self.url_items):
-            self.url_items.pop(index)
-            self._refresh_url_list()
-            self._update_counter()
+            self._remove_by_id(self.url_items[index].id)
+    
+    def _remove_by_id(self, item_id: str):
+        """Remove the URL with the given item id"""
+        url_item = self._items_by_id.pop(item_id, None)
+        if url_item is None:
+            return
+        
+        self.url_items.remove(url_item)
+        self._url_index.pop(url_item.canonical, None)
+        self._status_counts[url_item.status] -= 1
+        
+        # Rows below move up; _render_visible re-places the ones in view
+        self._destroy_row(url_item)
+        self._resize_spacer()
+        self._schedule_render()
+        self._update_counter()
     
     def clear_all(self):
         """Clear all URLs"""
         self.url_items.clear()
+        self._url_index.clear()
+        self._items_by_id.clear()
+        self._status_counts.clear()
         self._refresh_url_list()
         self._update_counter()
     
@@ -239,8 +409,20 @@ class URLManager(ctk.CTkFrame):
     
     def _remove_failed_urls(self):
         """Remove all URLs with failed status"""
-        self.url_items = [item for item in self.url_items if item.status != "failed"]
-        self._refresh_url_list()
+        failed = [item for item in self.url_items if item.status == "failed"]
+        if not failed:
+            return
+        
+        # Only the failed rows are destroyed; remaining rows are re-placed
+        for item in failed:
+            del self._items_by_id[item.id]
+            self._url_index.pop(item.canonical, None)
+            self._destroy_row(item)
+        
+        self.url_items[:] = [item for item in self.url_items if item.status != "failed"]
+        self._status_counts["failed"] = 0
+        self._resize_spacer()
+        self._schedule_render()
         self._update_counter()
     
     def _validate_all_urls(self):
@@ -249,151 +431,243 @@ class URLManager(ctk.CTkFrame):
             return
             
         # Update UI to show validation in progress
+        todo = []
         for item in self.url_items:
             if item.status == "ready":
-                item.status = "processing"
+                self._set_status(item, "processing")
+                todo.append((item.id, item.url))
         
-        self._refresh_url_list()
+        self._update_row_widgets()
+        self._update_counter()
         
-        # Run validation in background
+        if not todo:
+            return
+        
+        # Run validation in background on a snapshot, so the worker never
+        # reads url_items while the UI thread adds or removes URLs
         threading.Thread(
             target=self._background_validation,
+            args=(todo, self.backend_generator),
             daemon=True
         ).start()
     
-    def _background_validation(self):
-        """Background thread for URL validation"""
-        for i, item in enumerate(self.url_items):
-            if item.status == "processing":
-                try:
-                    # Use backend generator for validation
-                    if self.backend_generator:
-                        # Simulate validation using categorize_url method
-                        category = self.backend_generator.categorize_url(item.url)
-                        item.category = category
-                        item.status = "ready" if category else "invalid"
-                        
-                        if item.status == "invalid":
-                            item.error_message = "Unable to categorize content"
-                    else:
-                        # Fallback validation
-                        if self._is_valid_mslearn_url(item.url):
-                            item.status = "ready"
-                        else:
-                            item.status = "invalid"
-                            item.error_message = "Invalid MS Learn URL format"
-                            
-                except Exception as e:
-                    item.status = "failed"
-                    item.error_message = str(e)
-        
-        # Schedule UI update on main thread
-        self.after(0, self._refresh_url_list)
+    def _background_validation(self, todo, backend_generator):
+        """Background thread for URL validation of (item id, url) pairs"""
+        urls = [url for _, url in todo]
+        
+        # Categorization may block, so validate several URLs at once
+        validate = functools.partial(self._validate_url, backend_generator)
+        with ThreadPoolExecutor(max_workers=min(self.VALIDATION_WORKERS, len(urls))) as executor:
+            results = list(executor.map(validate, urls))
+        
+        # Apply results and update UI on main thread
+        self.after(0, self._apply_validation_results, [
+            (item_id, *result) for (item_id, _), result in zip(todo, results)
+        ])
+    
+    @staticmethod
+    def _validate_url(backend_generator, url: str):
+        """Validate a single URL with the backend, returning (status, category, error_message)"""
+        try:
+            # Simulate validation using categorize_url method
+            category = backend_generator.categorize_url(url)
+            if category:
+                return "ready", category, ""
+            return "invalid", category, "Unable to categorize content"
+            
+        except Exception as e:
+            return "failed", None, str(e)
+    
+    def _apply_validation_results(self, results):
+        """Store background validation results (item id, status, category, error) and render them"""
+        changed = []
+        for item_id, status, category, error_message in results:
+            item = self._items_by_id.get(item_id)
+            if item is None:
+                continue  # Removed while validation was running
+            
+            if category is not None:
+                item.category = category
+            if error_message:
+                item.error_message = error_message
+            self._set_status(item, status)
+            changed.append(item)
+        
+        for item in changed:
+            self._update_row_widget(item)
+        self._update_counter()
     
     def _is_valid_mslearn_url(self, url: str) -> bool:
         """Validate if URL is a valid MS Learn URL"""
-        try:
-            parsed = urlparse(url)
-            return (
-                parsed.scheme in ['http', 'https'] and
-                'learn.microsoft.com' in parsed.netloc and
-                len(parsed.path) > 1
-            )
-        except:
-            return False
+        return _validate_mslearn(url)
     
     def _create_url_widget(self, url_item: URLItem, index: int):
         """Create widget for a single URL item"""
-        # Container frame for this URL
-        url_frame = ctk.CTkFrame(self.scrollable_frame)
-        url_frame.grid(row=index, column=0, sticky="ew", padx=5, pady=2)
+        # Container frame for this URL (fixed height, placed by list index)
+        url_frame = ctk.CTkFrame(self.scrollable_frame, height=self.ROW_HEIGHT - 4)
+        url_frame.place(x=0, y=index * self.ROW_HEIGHT + 2, relwidth=1)
+        url_frame.grid_propagate(False)
+        url_frame.grid_rowconfigure(0, weight=1)
         url_frame.grid_columnconfigure(1, weight=1)
         
         # Status indicator
-        status_colors = {
-            "ready": "#1f538d",
-            "processing": "#f59e0b",
-            "completed": "#059669",
-            "failed": "#dc2626",
-            "invalid": "#6b7280"
-        }
-        
         status_indicator = ctk.CTkLabel(
             url_frame,
             text="●",
-            font=ctk.CTkFont(size=14),
-            text_color=status_colors.get(url_item.status, "#6b7280"),
+            font=self._f_indicator,
+            text_color=self._status_color(url_item),
             width=20
         )
-        status_indicator.grid(row=0, column=0, padx=(10, 5), pady=10)
+        status_indicator.grid(row=0, column=0, padx=(10, 5), pady=3)
         
         # URL display (truncated if too long)
-        display_url = url_item.url
-        if len(display_url) > 80:
-            display_url = display_url[:77] + "..."
-            
         url_label = ctk.CTkLabel(
             url_frame,
-            text=display_url,
-            font=ctk.CTkFont(size=11),
+            text=url_item.display_url,
+            font=self._f_url,
             anchor="w"
         )
-        url_label.grid(row=0, column=1, sticky="ew", padx=5, pady=10)
+        url_label.grid(row=0, column=1, sticky="ew", padx=5, pady=3)
         
         # Category/Status info
-        if url_item.category:
-            info_text = f"[{url_item.category}]"
-        elif url_item.error_message:
-            info_text = f"Error: {url_item.error_message[:30]}..."
-        else:
-            info_text = url_item.status.title()
-            
         info_label = ctk.CTkLabel(
             url_frame,
-            text=info_text,
-            font=ctk.CTkFont(size=10),
+            text=self._info_text(url_item),
+            font=self._f_small,
             text_color="gray"
         )
-        info_label.grid(row=0, column=2, padx=5, pady=10)
+        info_label.grid(row=0, column=2, padx=5, pady=3)
         
         # Remove button
         remove_button = ctk.CTkButton(
             url_frame,
             text="×",
-            command=lambda i=index: self.remove_url(i),
+            command=lambda item_id=url_item.id: self._remove_by_id(item_id),
             width=30,
             height=30,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._f_title,
             fg_color="transparent",
             text_color=("gray10", "gray90"),
             hover_color=("gray20", "gray70")
         )
-        remove_button.grid(row=0, column=3, padx=(5, 10), pady=10)
+        remove_button.grid(row=0, column=3, padx=(5, 10), pady=3)
+        
+        # Keep the widgets that change with the item's status
+        self._visible_rows[url_item.id] = index
+        url_item.row_frame = url_frame
+        url_item.status_indicator = status_indicator
+        url_item.info_label = info_label
+    
+    def _status_color(self, url_item: URLItem) -> str:
+        """Indicator color for an item's status"""
+        return _STATUS_COLORS.get(url_item.status, _DEFAULT_STATUS_COLOR)
+    
+    def _info_text(self, url_item: URLItem) -> str:
+        """Category/status text shown next to an item"""
+        if url_item.category:
+            return f"[{url_item.category}]"
+        elif url_item.error_message:
+            return f"Error: {url_item.error_message[:30]}..."
+        else:
+            return url_item.status.title()
+    
+    def _update_row_widget(self, url_item: URLItem):
+        """Update an existing row in place after its item's status changed"""
+        if url_item.row_frame is None:
+            return
+        
+        url_item.status_indicator.configure(text_color=self._status_color(url_item))
+        url_item.info_label.configure(text=self._info_text(url_item))
+    
+    def _update_row_widgets(self):
+        """Update every row in place (no widgets are recreated)"""
+        for item_id in self._visible_rows:
+            self._update_row_widget(self._items_by_id[item_id])
     
     def _refresh_url_list(self):
         """Refresh the entire URL list display"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # Hide the list while rebuilding so Tk lays it out once, not per row
+        self.scrollable_frame.grid_remove()
         
-        # Recreate all URL widgets
-        for i, url_item in enumerate(self.url_items):
-            self._create_url_widget(url_item, i)
+        # Clear existing row widgets (the spacer stays)
+        for widget in self.scrollable_frame.winfo_children():
+            if widget is not self.rows_spacer:
+                widget.destroy()
+        for url_item in self.url_items:
+            url_item.row_frame = None
+        self._visible_rows.clear()
+        
+        # Recreate the rows in view
+        self._resize_spacer()
+        self._render_visible()
+        
+        self.scrollable_frame.grid()
+        self.scrollable_frame.update_idletasks()
+    
+    def _resize_spacer(self):
+        """Size the spacer to the full list height"""
+        self.rows_spacer.configure(height=max(1, len(self.url_items) * self.ROW_HEIGHT))
+    
+    def _schedule_render(self):
+        """Render visible rows once the current burst of changes is done"""
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.after_idle(self._render_visible)
+    
+    def _render_visible(self):
+        """Create widgets for rows in view and drop those scrolled out of it"""
+        self._render_scheduled = False
+        count = len(self.url_items)
+        top, bottom = self.scrollable_frame._parent_canvas.yview()
+        first = max(0, int(top * count) - self.ROW_OVERSCAN)
+        last = min(count, int(bottom * count) + 1 + self.ROW_OVERSCAN)
+        
+        wanted = {self.url_items[i].id: i for i in range(first, last)}
+        for item_id in [item_id for item_id in self._visible_rows if item_id not in wanted]:
+            url_item = self._items_by_id.get(item_id)
+            if url_item is not None:
+                self._destroy_row(url_item)
+            else:
+                del self._visible_rows[item_id]
+        
+        for item_id, index in wanted.items():
+            url_item = self._items_by_id[item_id]
+            shown_at = self._visible_rows.get(item_id)
+            if shown_at is None:
+                self._create_url_widget(url_item, index)
+            elif shown_at != index:
+                url_item.row_frame.place(x=0, y=index * self.ROW_HEIGHT + 2, relwidth=1)
+                self._visible_rows[item_id] = index
+    
+    def _destroy_row(self, url_item: URLItem):
+        """Destroy an item's row widgets, if it has any"""
+        self._visible_rows.pop(url_item.id, None)
+        if url_item.row_frame is not None:
+            url_item.row_frame.destroy()
+            url_item.row_frame = None
+            url_item.status_indicator = None
+            url_item.info_label = None
+    
+    def _set_status(self, url_item: URLItem, status: str):
+        """Change an item's status, keeping the per-status counts current"""
+        self._status_counts[url_item.status] -= 1
+        self._status_counts[status] += 1
+        url_item.status = status
     
     def _update_counter(self):
         """Update the URL counter display"""
         count = len(self.url_items)
-        status_counts = {}
-        for item in self.url_items:
-            status_counts[item.status] = status_counts.get(item.status, 0) + 1
         
         if count == 0:
             counter_text = "0 URLs"
         else:
-            ready_count = status_counts.get("ready", 0)
+            ready_count = self._status_counts["ready"]
             counter_text = f"{count} URLs ({ready_count} ready)"
         
         self.counter_label.configure(text=counter_text)
+        
+        for callback in self.status_change_callbacks:
+            callback()
     
     def get_urls(self) -> List[str]:
         """Get all URLs as strings"""
@@ -403,26 +677,63 @@ class URLManager(ctk.CTkFrame):
         """Get URLs that are ready for processing"""
         return [item.url for item in self.url_items if item.status == "ready"]
     
+    @property
+    def url_count(self) -> int:
+        """Number of URLs in the list"""
+        return len(self.url_items)
+    
+    def get_status_counts(self) -> Counter:
+        """Get the number of URLs per status"""
+        return self._status_counts.copy()
+    
+    def iter_url_items(self) -> Iterator[URLItem]:
+        """Iterate over URL items without copying the list (read-only use)"""
+        return iter(self.url_items)
+    
     def get_url_items(self) -> List[URLItem]:
         """Get all URL items with metadata"""
         return self.url_items.copy()
     
     def update_url_status(self, url: str, status: str, **kwargs):
-        """Update the status of a specific URL"""
-        for item in self.url_items:
-            if item.url == url:
-                item.status = status
-                if 'title' in kwargs:
-                    item.title = kwargs['title']
-                if 'category' in kwargs:
-                    item.category = kwargs['category']
-                if 'error_message' in kwargs:
-                    item.error_message = kwargs['error_message']
+        """Update the status of a specific URL (safe to call from any thread)"""
+        self._update_q.put((url, status, kwargs))
+    
+    def _drain_updates(self):
+        """Apply queued status updates, then poll again"""
+        changed = {}
+        for _ in range(self.UPDATE_DRAIN_LIMIT):
+            try:
+                url, status, kwargs = self._update_q.get_nowait()
+            except queue.Empty:
                 break
+            
+            item = self._url_index.get(_canonicalize(url))
+            if item is None:
+                continue
+            
+            self._set_status(item, status)
+            if 'title' in kwargs:
+                item.title = kwargs['title']
+            if 'category' in kwargs:
+                item.category = kwargs['category']
+            if 'error_message' in kwargs:
+                item.error_message = kwargs['error_message']
+            changed[item.id] = item
+        
+        if changed:
+            for item in changed.values():
+                self._update_row_widget(item)
+            self._update_counter()
+        
+        self._drain_after_id = self.after(self.UPDATE_POLL_MS, self._drain_updates)
+    
+    def destroy(self):
+        """Stop polling for status updates before destroying the manager"""
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
         
-        # Refresh display
-        self.after(0, self._refresh_url_list)
-        self.after(0, self._update_counter)
+        super().destroy()
     
     def add_status_change_callback(self, callback: Callable):
         """Add callback for status changes"""
@@ -7,14 +7,16 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from pathlib import Path
-import sys
+from contextlib import contextmanager
+import queue
+import threading
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from ..config.settings import Settings
+from .components import URLManager, OutputPanel
 
-from config.settings import Settings
-from gui.components import URLManager, OutputPanel
-from core.mslearn_generator import MSLearnTrainingDataGenerator
+# File dialog filters for URL lists
+_OPEN_FILETYPES = (("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*"))
+_SAVE_FILETYPES = (("Text files", "*.txt"), ("CSV files", "*.csv"))
 
 class MSLearnGUIApp:
     """
@@ -22,6 +24,48 @@ class MSLearnGUIApp:
     Phase 1.4: Enhanced with Output Panel component integration
     """
     
+    # URL list files are read on a worker thread and added in chunks
+    URL_LOAD_CHUNK_SIZE = 256
+    URL_LOAD_CHUNKS_PER_POLL = 8  # Keeps each UI-thread drain short
+    URL_LOAD_POLL_MS = 16
+    URL_LOAD_IDLE_POLL_MS = 50
+    
+    # Status bar progress text while URLs are processing / otherwise
+    _STATUS_FMT_PROCESSING = "%d URLs | %d ready | %d processing | %d failed | Settings: %s"
+    _STATUS_FMT_IDLE = "%d URLs | %d ready | %d completed | %d failed | Settings: %s"
+    
+    # Menu entries, shown in this order ("separator" draws a divider)
+    _FILE_VALUES = ("New Session", "Open URL List...", "Save URL List...", "separator", "Exit")
+    _EDIT_VALUES = ("Add URL", "Remove Selected", "Clear All", "Validate All", "separator", "Validate Settings", "Preferences...")
+    _VIEW_VALUES = ("Light Mode", "Dark Mode", "System Mode", "separator", "Show Log", "Show Statistics")
+    _HELP_VALUES = ("User Guide", "Keyboard Shortcuts", "separator", "About")
+    
+    # Menu choice -> handler method name
+    _FILE_MENU = {
+        "New Session": "_new_session",
+        "Open URL List...": "_open_url_list",
+        "Save URL List...": "_save_url_list",
+        "Exit": "_on_closing"
+    }
+    _EDIT_MENU = {
+        "Add URL": "_focus_url_entry",
+        "Remove Selected": "_remove_selected_urls",
+        "Clear All": "_clear_all_urls",
+        "Validate All": "_validate_all_urls",
+        "Validate Settings": "_validate_settings",
+        "Preferences...": "_show_preferences"
+    }
+    _VIEW_MENU = {
+        "Show Log": "_show_log",
+        "Show Statistics": "_show_statistics"
+    }
+    _HELP_MENU = {
+        "User Guide": "_show_user_guide",
+        "Keyboard Shortcuts": "_show_keyboard_shortcuts",
+        "About": "_show_about"
+    }
+    _THEME_CHOICES = {"Light Mode": "light", "Dark Mode": "dark", "System Mode": "system"}
+    
     def __init__(self):
         """Initialize the main application window"""
         # Set appearance mode and color theme from settings
@@ -31,10 +75,11 @@ class MSLearnGUIApp:
         color_theme = self.settings.get("color_theme", "blue")
         
         ctk.set_appearance_mode(theme)
-        ctk.set_default_color_theme(color_theme)
         
-        # Initialize backend generator
-        self.backend_generator = MSLearnTrainingDataGenerator()
+        # customtkinter loads "blue" on import - only parse another theme file
+        # (must happen before any widget is created)
+        if color_theme != "blue":
+            ctk.set_default_color_theme(color_theme)
         
         # Create main window
         self.root = ctk.CTk()
@@ -47,9 +92,31 @@ class MSLearnGUIApp:
         except:
             pass  # Icon setting is optional
         
+        # Shared fonts - one Tk font object per style instead of one per widget
+        self._f_page_title = ctk.CTkFont(size=18, weight="bold")
+        self._f_title = ctk.CTkFont(size=16, weight="bold")
+        self._f_subtitle = ctk.CTkFont(size=14)
+        self._f_body = ctk.CTkFont(size=12)
+        
+        # Cleared by _on_closing so late callbacks don't touch destroyed widgets
+        self._alive = True
+        
+        # Status bar refreshes are coalesced into one per idle (see _update_status_info)
+        self._status_pending = False
+        self._status_after_id = None
+        self._batch_depth = 0
+        self._label_texts = {}  # Status bar label -> text last shown
+        
         # Setup window configuration
         self._setup_window_geometry()
         
+        # Show the window before loading the backend (lxml, requests, ...)
+        self.root.update_idletasks()
+        
+        # Initialize backend generator
+        from ..core.mslearn_generator import MSLearnTrainingDataGenerator
+        self.backend_generator = MSLearnTrainingDataGenerator()
+        
         # Create menu bar
         self._create_menu_bar()
         
@@ -76,8 +143,8 @@ class MSLearnGUIApp:
         # Set minimum size
         self.root.minsize(1000, 750)  # Increased for Output Panel
         
-        if window_pos:
-            # Use saved position
+        if window_pos and len(window_pos) == 2:
+            # Restore the saved position directly - no screen size round-trips
             self.root.geometry(f"{window_size[0]}x{window_size[1]}+{window_pos[0]}+{window_pos[1]}")
         else:
             # Center on screen
@@ -97,7 +164,7 @@ class MSLearnGUIApp:
         # File menu button
         self.file_menu_btn = ctk.CTkOptionMenu(
             self.menu_frame,
-            values=["New Session", "Open URL List...", "Save URL List...", "separator", "Exit"],
+            values=list(self._FILE_VALUES),
             command=self._handle_file_menu,
             width=80
         )
@@ -107,7 +174,7 @@ class MSLearnGUIApp:
         # Edit menu button
         self.edit_menu_btn = ctk.CTkOptionMenu(
             self.menu_frame,
-            values=["Add URL", "Remove Selected", "Clear All", "Validate All", "separator", "Validate Settings", "Preferences..."],
+            values=list(self._EDIT_VALUES),
             command=self._handle_edit_menu,
             width=80
         )
@@ -117,7 +184,7 @@ class MSLearnGUIApp:
         # View menu button
         self.view_menu_btn = ctk.CTkOptionMenu(
             self.menu_frame,
-            values=["Light Mode", "Dark Mode", "System Mode", "separator", "Show Log", "Show Statistics"],
+            values=list(self._VIEW_VALUES),
             command=self._handle_view_menu,
             width=80
         )
@@ -127,7 +194,7 @@ class MSLearnGUIApp:
         # Help menu button
         self.help_menu_btn = ctk.CTkOptionMenu(
             self.menu_frame,
-            values=["User Guide", "Keyboard Shortcuts", "separator", "About"],
+            values=list(self._HELP_VALUES),
             command=self._handle_help_menu,
             width=80
         )
@@ -138,7 +205,7 @@ class MSLearnGUIApp:
         self.title_label = ctk.CTkLabel(
             self.menu_frame,
             text="MS Learn Training Data Generator v0.1.4",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._f_title
         )
         self.title_label.pack(side="right", padx=10, pady=5)
     
@@ -149,7 +216,7 @@ class MSLearnGUIApp:
         self.main_container.pack(fill="both", expand=True, padx=10, pady=5)
         
         # Create tabbed interface
-        self.tab_view = ctk.CTkTabview(self.main_container)
+        self.tab_view = ctk.CTkTabview(self.main_container, command=self._on_tab_changed)
         self.tab_view.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create tabs
@@ -157,14 +224,27 @@ class MSLearnGUIApp:
         self.results_tab = self.tab_view.add("Results") 
         self.settings_tab = self.tab_view.add("Settings")
         
-        # Setup Processing tab layout
+        # Setup Processing tab layout (the landing tab)
         self._setup_processing_tab()
         
-        # Setup Results tab layout
-        self._setup_results_tab()
-        
-        # Setup Settings tab layout
-        self._setup_settings_tab()
+        # Results and Settings tabs are built on first visit
+        self._tab_builders = {
+            "Results": self._setup_results_tab,
+            "Settings": self._setup_settings_tab
+        }
+        self._tabs_built = {"Processing"}
+    
+    def _on_tab_changed(self):
+        """Build the selected tab the first time it is shown"""
+        name = self.tab_view.get()
+        if name not in self._tabs_built:
+            self._tabs_built.add(name)
+            self._tab_builders[name]()
+    
+    def _show_tab(self, name):
+        """Switch to a tab, building it first if needed"""
+        self.tab_view.set(name)
+        self._on_tab_changed()
     
     def _setup_processing_tab(self):
         """Setup the main processing tab layout"""
@@ -201,7 +281,7 @@ class MSLearnGUIApp:
         control_title = ctk.CTkLabel(
             self.control_section,
             text="Progress & Control",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._f_title
         )
         control_title.grid(row=0, column=0, pady=(10, 5), padx=10, sticky="w")
         
@@ -209,7 +289,7 @@ class MSLearnGUIApp:
         self.progress_placeholder = ctk.CTkLabel(
             self.control_section,
             text="Progress tracking components\nwill be added in Phase 1.5\n\nUse the Output Panel above to\nconfigure processing settings",
-            font=ctk.CTkFont(size=12),
+            font=self._f_body,
             text_color="gray"
         )
         self.progress_placeholder.grid(row=1, column=0, pady=20, padx=20)
@@ -249,7 +329,7 @@ class MSLearnGUIApp:
         results_title = ctk.CTkLabel(
             self.results_tab,
             text="Processing Results",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self._f_page_title
         )
         results_title.pack(pady=(20, 10))
         
@@ -257,7 +337,7 @@ class MSLearnGUIApp:
         self.results_placeholder = ctk.CTkLabel(
             self.results_tab,
             text="Results preview and analytics\nwill be available after\nPhase 2 implementation",
-            font=ctk.CTkFont(size=14),
+            font=self._f_subtitle,
             text_color="gray"
         )
         self.results_placeholder.pack(pady=50)
@@ -268,70 +348,60 @@ class MSLearnGUIApp:
         settings_title = ctk.CTkLabel(
             self.settings_tab,
             text="Application Settings",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self._f_page_title
         )
         settings_title.pack(pady=(20, 20))
         
-        # Settings frame
+        # Settings frame - one grid instead of nested packed frames
         settings_frame = ctk.CTkFrame(self.settings_tab)
         settings_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        settings_frame.grid_columnconfigure(1, weight=1)
         
         # Appearance settings
-        appearance_frame = ctk.CTkFrame(settings_frame)
-        appearance_frame.pack(fill="x", padx=20, pady=10)
-        
         ctk.CTkLabel(
-            appearance_frame,
+            settings_frame,
             text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=10, pady=(10, 5))
+            font=self._f_title
+        ).grid(row=0, column=0, columnspan=2, sticky="w", padx=20, pady=(20, 5))
         
         # Theme selection
-        theme_frame = ctk.CTkFrame(appearance_frame)
-        theme_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(theme_frame, text="Theme:").pack(side="left", padx=10)
+        ctk.CTkLabel(settings_frame, text="Theme:").grid(row=1, column=0, sticky="w", padx=(30, 10), pady=5)
         
         self.theme_var = tk.StringVar(value=self.settings.get("theme", "system"))
         self.theme_menu = ctk.CTkOptionMenu(
-            theme_frame,
+            settings_frame,
             variable=self.theme_var,
             values=["system", "light", "dark"],
             command=self._change_theme
         )
-        self.theme_menu.pack(side="left", padx=10)
+        self.theme_menu.grid(row=1, column=1, sticky="w", padx=10, pady=5)
         
         # Color theme selection
-        color_frame = ctk.CTkFrame(appearance_frame)
-        color_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(color_frame, text="Color Theme:").pack(side="left", padx=10)
+        ctk.CTkLabel(settings_frame, text="Color Theme:").grid(row=2, column=0, sticky="w", padx=(30, 10), pady=5)
         
         self.color_theme_var = tk.StringVar(value=self.settings.get("color_theme", "blue"))
         self.color_theme_menu = ctk.CTkOptionMenu(
-            color_frame,
+            settings_frame,
             variable=self.color_theme_var,
             values=["blue", "dark-blue", "green"],
             command=self._change_color_theme
         )
-        self.color_theme_menu.pack(side="left", padx=10)
+        self.color_theme_menu.grid(row=2, column=1, sticky="w", padx=10, pady=5)
         
         # Processing note
-        processing_note = ctk.CTkFrame(settings_frame)
-        processing_note.pack(fill="x", padx=20, pady=10)
-        
         ctk.CTkLabel(
-            processing_note,
+            settings_frame,
             text="Processing Settings",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", padx=10, pady=(10, 5))
+            font=self._f_title
+        ).grid(row=3, column=0, columnspan=2, sticky="w", padx=20, pady=(20, 5))
         
         ctk.CTkLabel(
-            processing_note,
+            settings_frame,
             text="Processing settings have been moved to the Output Panel\nin the Processing tab for better workflow integration.",
-            font=ctk.CTkFont(size=12),
-            text_color="gray"
-        ).pack(anchor="w", padx=10, pady=(0, 10))
+            font=self._f_body,
+            text_color="gray",
+            justify="left"
+        ).grid(row=4, column=0, columnspan=2, sticky="w", padx=30, pady=(0, 10))
     
     def _setup_status_bar(self):
         """Setup the status bar at the bottom"""
@@ -343,7 +413,7 @@ class MSLearnGUIApp:
         self.status_label = ctk.CTkLabel(
             self.status_frame,
             text="Ready",
-            font=ctk.CTkFont(size=12)
+            font=self._f_body
         )
         self.status_label.pack(side="left", padx=10, pady=5)
         
@@ -351,7 +421,7 @@ class MSLearnGUIApp:
         self.progress_info_label = ctk.CTkLabel(
             self.status_frame,
             text="0 URLs | 0 ready | Settings: Not configured",
-            font=ctk.CTkFont(size=12),
+            font=self._f_body,
             text_color="gray"
         )
         self.progress_info_label.pack(side="right", padx=10, pady=5)
@@ -360,110 +430,116 @@ class MSLearnGUIApp:
         """Bind keyboard shortcuts and window events"""
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
-        # Keyboard shortcuts
-        self.root.bind('<Control-n>', lambda e: self._handle_file_menu("New Session"))
-        self.root.bind('<Control-o>', lambda e: self._handle_file_menu("Open URL List..."))
-        self.root.bind('<Control-s>', lambda e: self._handle_file_menu("Save URL List..."))
-        self.root.bind('<Control-q>', lambda e: self._on_closing())
-        self.root.bind('<F1>', lambda e: self._handle_help_menu("User Guide"))
+        # Keyboard shortcuts (handlers take the Tk event as an optional argument)
+        self.root.bind('<Control-n>', self._new_session)
+        self.root.bind('<Control-o>', self._open_url_list)
+        self.root.bind('<Control-s>', self._save_url_list)
+        self.root.bind('<Control-q>', self._on_closing)
+        self.root.bind('<F1>', self._show_user_guide)
         
         # URL management shortcuts
-        self.root.bind('<Control-u>', lambda e: self._focus_url_entry())
-        self.root.bind('<F5>', lambda e: self._handle_edit_menu("Validate All"))
+        self.root.bind('<Control-u>', self._focus_url_entry)
+        self.root.bind('<F5>', self._validate_all_urls)
         
         # Output panel shortcuts
-        self.root.bind('<Control-b>', lambda e: self._browse_output_folder())
-        self.root.bind('<F6>', lambda e: self._handle_edit_menu("Validate Settings"))
+        self.root.bind('<Control-b>', self._browse_output_folder)
+        self.root.bind('<F6>', self._validate_settings)
+    
+    def _dispatch_menu(self, handlers, choice):
+        """Call the handler method registered for a menu choice"""
+        handler = handlers.get(choice)
+        if handler:
+            getattr(self, handler)()
     
     def _handle_file_menu(self, choice):
         """Handle file menu selections"""
-        if choice == "New Session":
-            self._new_session()
-        elif choice == "Open URL List...":
-            self._open_url_list()
-        elif choice == "Save URL List...":
-            self._save_url_list()
-        elif choice == "Exit":
-            self._on_closing()
+        self._dispatch_menu(self._FILE_MENU, choice)
     
     def _handle_edit_menu(self, choice):
         """Handle edit menu selections"""
-        if choice == "Add URL":
-            self._focus_url_entry()
-        elif choice == "Remove Selected":
-            self._remove_selected_urls()
-        elif choice == "Clear All":
-            self._clear_all_urls()
-        elif choice == "Validate All":
-            self._validate_all_urls()
-        elif choice == "Validate Settings":
-            self._validate_settings()
-        elif choice == "Preferences...":
-            self.tab_view.set("Settings")
+        self._dispatch_menu(self._EDIT_MENU, choice)
     
     def _handle_view_menu(self, choice):
         """Handle view menu selections"""
-        if choice in ["Light Mode", "Dark Mode", "System Mode"]:
-            theme_map = {"Light Mode": "light", "Dark Mode": "dark", "System Mode": "system"}
-            self._change_theme(theme_map[choice])
-        elif choice == "Show Log":
-            # Will be implemented in Phase 1.6
-            self._update_status("Log view will be available in Phase 1.6")
-        elif choice == "Show Statistics":
-            # Will be implemented in Phase 2
-            self._update_status("Statistics will be available in Phase 2")
+        theme = self._THEME_CHOICES.get(choice)
+        if theme:
+            self._change_theme(theme)
+        else:
+            self._dispatch_menu(self._VIEW_MENU, choice)
     
     def _handle_help_menu(self, choice):
         """Handle help menu selections"""
-        if choice == "User Guide":
-            messagebox.showinfo(
-                "User Guide",
-                "MS Learn Training Data Generator\n\n"
-                "This application extracts high-quality training data from Microsoft Learn documentation.\n\n"
-                "Current Phase: 1.4 - Output & Settings Panel\n"
-                "✓ Add/remove URLs with validation\n"
-                "✓ Output folder configuration\n"
-                "✓ Category selection and customization\n"
-                "✓ Processing settings with validation\n\n"
-                "Next: Phase 1.5 - Progress & Processing Control"
-            )
-        elif choice == "Keyboard Shortcuts":
-            messagebox.showinfo(
-                "Keyboard Shortcuts",
-                "File Operations:\n"
-                "Ctrl+N - New Session\n"
-                "Ctrl+O - Open URL List\n"
-                "Ctrl+S - Save URL List\n"
-                "Ctrl+Q - Exit\n\n"
-                "URL Management:\n"
-                "Ctrl+U - Focus URL entry\n"
-                "F5 - Validate all URLs\n\n"
-                "Output Settings:\n"
-                "Ctrl+B - Browse output folder\n"
-                "F6 - Validate settings\n\n"
-                "Help:\n"
-                "F1 - User Guide"
-            )
-        elif choice == "About":
-            messagebox.showinfo(
-                "About",
-                "MS Learn Training Data Generator\n"
-                "Version: 0.1.4 (Phase 1.4)\n\n"
-                "A professional GUI for extracting high-quality training data\n"
-                "from Microsoft Learn documentation.\n\n"
-                "✓ URL Management with validation\n"
-                "✓ Output & settings configuration\n"
-                "✓ Category selection and customization\n"
-                "✓ Processing parameter validation\n\n"
-                "Built with CustomTkinter\n"
-                "© 2025 MS Learn GUI Team"
-            )
+        self._dispatch_menu(self._HELP_MENU, choice)
+    
+    def _show_preferences(self):
+        """Open the Settings tab"""
+        self._show_tab("Settings")
+    
+    def _show_log(self):
+        """Show the processing log"""
+        # Will be implemented in Phase 1.6
+        self._update_status("Log view will be available in Phase 1.6")
+    
+    def _show_statistics(self):
+        """Show processing statistics"""
+        # Will be implemented in Phase 2
+        self._update_status("Statistics will be available in Phase 2")
+    
+    def _show_user_guide(self, event=None):
+        """Show the user guide"""
+        messagebox.showinfo(
+            "User Guide",
+            "MS Learn Training Data Generator\n\n"
+            "This application extracts high-quality training data from Microsoft Learn documentation.\n\n"
+            "Current Phase: 1.4 - Output & Settings Panel\n"
+            "✓ Add/remove URLs with validation\n"
+            "✓ Output folder configuration\n"
+            "✓ Category selection and customization\n"
+            "✓ Processing settings with validation\n\n"
+            "Next: Phase 1.5 - Progress & Processing Control"
+        )
+    
+    def _show_keyboard_shortcuts(self):
+        """Show the keyboard shortcut reference"""
+        messagebox.showinfo(
+            "Keyboard Shortcuts",
+            "File Operations:\n"
+            "Ctrl+N - New Session\n"
+            "Ctrl+O - Open URL List\n"
+            "Ctrl+S - Save URL List\n"
+            "Ctrl+Q - Exit\n\n"
+            "URL Management:\n"
+            "Ctrl+U - Focus URL entry\n"
+            "F5 - Validate all URLs\n\n"
+            "Output Settings:\n"
+            "Ctrl+B - Browse output folder\n"
+            "F6 - Validate settings\n\n"
+            "Help:\n"
+            "F1 - User Guide"
+        )
+    
+    def _show_about(self):
+        """Show the about dialog"""
+        messagebox.showinfo(
+            "About",
+            "MS Learn Training Data Generator\n"
+            "Version: 0.1.4 (Phase 1.4)\n\n"
+            "A professional GUI for extracting high-quality training data\n"
+            "from Microsoft Learn documentation.\n\n"
+            "✓ URL Management with validation\n"
+            "✓ Output & settings configuration\n"
+            "✓ Category selection and customization\n"
+            "✓ Processing parameter validation\n\n"
+            "Built with CustomTkinter\n"
+            "© 2025 MS Learn GUI Team"
+        )
     
     def _change_theme(self, theme):
         """Change application theme"""
         ctk.set_appearance_mode(theme)
         self.settings.set("theme", theme)
-        self.theme_var.set(theme)
+        if "Settings" in self._tabs_built:
+            self.theme_var.set(theme)
         self._update_status(f"Theme changed to {theme}")
     
     def _change_color_theme(self, color_theme):
@@ -471,61 +547,111 @@ class MSLearnGUIApp:
         self.settings.set("color_theme", color_theme)
         self._update_status(f"Color theme changed to {color_theme} (restart required)")
     
-    def _new_session(self):
+    def _new_session(self, event=None):
         """Start a new session"""
         self.url_manager.clear_all()
         self._update_status("New session started")
     
-    def _open_url_list(self):
+    def _open_url_list(self, event=None):
         """Open URL list from file"""
         file_path = filedialog.askopenfilename(
             title="Open URL List",
-            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=_OPEN_FILETYPES
         )
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    urls = [line.strip() for line in f.readlines() if line.strip()]
+            # Read the file on a worker thread; the UI adds URLs as chunks arrive
+            url_queue = queue.Queue()
+            threading.Thread(
+                target=self._read_url_file,
+                args=(file_path, url_queue),
+                daemon=True
+            ).start()
+            
+            self._update_status(f"Loading URLs from {Path(file_path).name}...")
+            self.root.after(
+                self.URL_LOAD_POLL_MS, self._drain_url_queue,
+                file_path, url_queue, 0, self.URL_LOAD_POLL_MS
+            )
+    
+    def _read_url_file(self, file_path, url_queue):
+        """Worker thread: queue a file's URLs in chunks, then None (or the error)"""
+        try:
+            chunk = []
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for raw in f:
+                    line = raw.strip()
+                    if line:
+                        chunk.append(line)
+                        if len(chunk) >= self.URL_LOAD_CHUNK_SIZE:
+                            url_queue.put(chunk)
+                            chunk = []
+            
+            if chunk:
+                url_queue.put(chunk)
+            url_queue.put(None)
+        except Exception as e:
+            url_queue.put(e)
+    
+    def _drain_url_queue(self, file_path, url_queue, loaded, delay):
+        """Add queued URL chunks, polling faster while chunks keep arriving"""
+        if not self._alive:
+            return
+        
+        received = False
+        with self.batch_updates():
+            for _ in range(self.URL_LOAD_CHUNKS_PER_POLL):
+                try:
+                    item = url_queue.get_nowait()
+                except queue.Empty:
+                    break
                 
-                for url in urls:
-                    self.url_manager.add_url(url)
+                if item is None:
+                    self.settings.add_recent_url_list(file_path)
+                    self._update_status(f"Loaded {loaded} URLs from {Path(file_path).name}")
+                    return
                 
-                self.settings.add_recent_url_list(file_path)
-                self._update_status(f"Loaded {len(urls)} URLs from {Path(file_path).name}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load URL list:\n{str(e)}")
-                self._update_status("Failed to load URL list")
+                if isinstance(item, Exception):
+                    messagebox.showerror("Error", f"Failed to load URL list:\n{str(item)}")
+                    self._update_status("Failed to load URL list")
+                    return
+                
+                self.url_manager.add_url_many(item)
+                loaded += len(item)
+                received = True
+        
+        # Adaptive polling: 1 ms while draining, backing off to the idle interval
+        delay = 1 if received else min(max(delay, 1) * 2, self.URL_LOAD_IDLE_POLL_MS)
+        self.root.after(delay, self._drain_url_queue, file_path, url_queue, loaded, delay)
     
-    def _save_url_list(self):
+    def _save_url_list(self, event=None):
         """Save current URL list"""
-        urls = self.url_manager.get_urls()
-        if not urls:
+        url_count = self.url_manager.url_count
+        if not url_count:
             self._update_status("No URLs to save")
             return
         
         file_path = filedialog.asksaveasfilename(
             title="Save URL List",
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv")]
+            filetypes=_SAVE_FILETYPES
         )
         if file_path:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    for url in urls:
-                        f.write(f"{url}\n")
+                    f.write("\n".join(item.url for item in self.url_manager.iter_url_items()) + "\n")
                 
-                self._update_status(f"Saved {len(urls)} URLs to {Path(file_path).name}")
+                self._update_status(f"Saved {url_count} URLs to {Path(file_path).name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save URL list:\n{str(e)}")
                 self._update_status("Failed to save URL list")
     
-    def _focus_url_entry(self):
+    def _focus_url_entry(self, event=None):
         """Focus the URL entry field"""
         self.tab_view.set("Processing")
         self.url_manager.url_entry.focus()
         self._update_status("Add URL by typing in the entry field")
     
-    def _browse_output_folder(self):
+    def _browse_output_folder(self, event=None):
         """Focus the output panel folder browser"""
         self.tab_view.set("Processing")
         self.output_panel._browse_output_folder()
@@ -537,28 +663,30 @@ class MSLearnGUIApp:
     
     def _clear_all_urls(self):
         """Clear all URLs"""
-        if self.url_manager.get_urls():
-            result = messagebox.askyesno(
-                "Clear All URLs",
-                f"Are you sure you want to clear all {len(self.url_manager.get_urls())} URLs?"
-            )
-            if result:
-                self.url_manager.clear_all()
-                self._update_status("All URLs cleared")
-        else:
+        url_count = self.url_manager.url_count
+        if not url_count:
             self._update_status("No URLs to clear")
+            return
+        
+        result = messagebox.askyesno(
+            "Clear All URLs",
+            f"Are you sure you want to clear all {url_count} URLs?"
+        )
+        if result:
+            self.url_manager.clear_all()
+            self._update_status("All URLs cleared")
     
-    def _validate_all_urls(self):
+    def _validate_all_urls(self, event=None):
         """Validate all URLs using backend"""
-        urls = self.url_manager.get_urls()
-        if not urls:
+        url_count = self.url_manager.url_count
+        if not url_count:
             self._update_status("No URLs to validate")
             return
         
         self.url_manager._validate_all_urls()
-        self._update_status(f"Validating {len(urls)} URLs...")
+        self._update_status(f"Validating {url_count} URLs...")
     
-    def _validate_settings(self):
+    def _validate_settings(self, event=None):
         """Validate output panel settings"""
         self.tab_view.set("Processing")
         self.output_panel._validate_settings()
@@ -596,27 +724,58 @@ class MSLearnGUIApp:
     
     def _on_url_status_change(self):
         """Handle URL status changes from URL manager"""
+        if not self._alive:
+            return
         self._update_status_info()
     
     def _on_output_setting_change(self, setting_name, value):
         """Handle output panel setting changes"""
+        if not self._alive:
+            return
         self._update_status(f"Setting updated: {setting_name}")
-        self._update_status_info()
     
     def _update_status(self, message):
         """Update status bar message"""
-        self.status_label.configure(text=message)
+        if not self._alive:
+            return
+        self._set_label_text(self.status_label, message)
         self._update_status_info()
     
+    def _set_label_text(self, label, text):
+        """Set a status bar label's text, skipping the widget call when it is unchanged"""
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.configure(text=text)
+    
+    @contextmanager
+    def batch_updates(self):
+        """Hold status bar refreshes until the outermost batch ends (reentrant)"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._status_pending:
+                self._update_status_info()
+    
     def _update_status_info(self):
+        """Schedule a status bar refresh - a burst of changes renders once"""
+        if not self._alive:
+            return
+        self._status_pending = True
+        if self._batch_depth == 0 and self._status_after_id is None:
+            self._status_after_id = self.root.after_idle(self._flush_status_info)
+    
+    def _flush_status_info(self):
         """Update status bar progress information"""
-        url_items = self.url_manager.get_url_items()
-        url_count = len(url_items)
+        self._status_after_id = None
+        self._status_pending = False
+        if not self._alive:
+            return
         
-        # Count by status
-        status_counts = {}
-        for item in url_items:
-            status_counts[item.status] = status_counts.get(item.status, 0) + 1
+        # Count by status (kept up to date by the URL manager)
+        status_counts = self.url_manager.get_status_counts()
+        url_count = self.url_manager.url_count
         
         ready_count = status_counts.get("ready", 0)
         failed_count = status_counts.get("failed", 0) + status_counts.get("invalid", 0)
@@ -628,39 +787,35 @@ class MSLearnGUIApp:
         settings_status = "✓ Ready" if settings_ready else "⚠️ Check Settings"
         
         if processing_count > 0:
-            status_text = f"{url_count} URLs | {ready_count} ready | {processing_count} processing | {failed_count} failed | Settings: {settings_status}"
+            status_text = self._STATUS_FMT_PROCESSING % (url_count, ready_count, processing_count, failed_count, settings_status)
         else:
-            status_text = f"{url_count} URLs | {ready_count} ready | {completed_count} completed | {failed_count} failed | Settings: {settings_status}"
+            status_text = self._STATUS_FMT_IDLE % (url_count, ready_count, completed_count, failed_count, settings_status)
         
-        self.progress_info_label.configure(text=status_text)
+        self._set_label_text(self.progress_info_label, status_text)
     
-    def _on_closing(self):
+    def _on_closing(self, event=None):
         """Handle window closing event"""
-        # Save window geometry and position
-        geometry = self.root.geometry()
-        if '+' in geometry and 'x' in geometry:
-            try:
-                size_and_pos = geometry.split('+')
-                size_str = size_and_pos[0]
-                pos_x, pos_y = int(size_and_pos[1]), int(size_and_pos[2])
-                
-                if 'x' in size_str:
-                    width, height = map(int, size_str.split('x'))
-                    self.settings.set("window_size", [width, height])
-                    self.settings.set("window_position", [pos_x, pos_y])
-            except (ValueError, IndexError):
-                pass  # Keep existing settings if parsing fails
+        if not self._alive:
+            return
+        self._alive = False
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+            self._status_after_id = None
+        
+        # Save window geometry and position (sizes back in unscaled units, as geometry() takes them)
+        scaling = ctk.ScalingTracker.get_window_scaling(self.root)
+        width = round(self.root.winfo_width() / scaling)
+        height = round(self.root.winfo_height() / scaling)
+        self.settings.set("window_size", [width, height])
+        self.settings.set("window_position", [self.root.winfo_x(), self.root.winfo_y()])
         
         # Settings are automatically saved by the output panel
         
         # Save and exit
         self.settings.save()
+        self.backend_generator.close()
         self.root.destroy()
     
     def run(self):
         """Run the application main loop"""
-        self.root.mainloop()
-
-if __name__ == "__main__":
-    app = MSLearnGUIApp()
-    app.run()
\ No newline at end of file
+        self.root.mainloop()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Unit tests for resuming an interrupted generator run
+"""
+
+import unittest
+import tempfile
+import json
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from src.core.mslearn_generator import MSLearnTrainingDataGenerator, _scan_progress_file
+
+BASE_URL = "https://learn.microsoft.com/en-us/windows-server"
+
+class TestResumeProgress(unittest.TestCase):
+    """
+    Test cases for crash-resume from the progress checkpoint
+    """
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.generator = MSLearnTrainingDataGenerator(
+            output_dir=self.output_dir, max_workers=1, request_delay=0, use_cache=False
+        )
+        
+        self.done_urls = [
+            f"{BASE_URL}/networking/dns/dns-overview",
+            f"{BASE_URL}/networking/technologies/dhcp/dhcp-top",
+        ]
+        self.new_url = f"{BASE_URL}/identity/ad-ds/get-started/virtual-dc/active-directory-domain-services-overview"
+        
+        # Two complete checkpoint lines followed by a line cut off mid-write
+        lines = [
+            orjson.dumps(self.generator.generate_training_item(self._content(url), self.generator.categorize_url(url)))
+            for url in self.done_urls
+        ]
+        self.complete_size = sum(len(line) + 1 for line in lines)
+        self.partial_line = orjson.dumps(self.generator.generate_training_item(
+            self._content(self.new_url), self.generator.categorize_url(self.new_url)
+        ))[:50]
+        
+        self.progress_file = self.output_dir / "ms_learn_progress.jsonl"
+        self.progress_file.write_bytes(b'\n'.join(lines) + b'\n' + self.partial_line)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.generator._close_progress()
+        self.generator.session.close()
+        self.temp_dir.cleanup()
+    
+    def _content(self, url):
+        """Build extracted page content that passes the quality checks"""
+        return {
+            'url': url,
+            'title': url.rsplit('/', 1)[-1],
+            'content': "Windows Server administrators manage Active Directory, DNS and DHCP "
+                       "with PowerShell cmdlets and Group Policy. " * 5,
+            'code_examples': ["Get-ADDomainController -Discover", "Get-DnsServerZone"],
+            'keyword_matches': 8,
+        }
+    
+    def test_scan_ignores_partial_line(self):
+        """Test that scanning stops at the last complete line"""
+        sources, categories, complete_size = _scan_progress_file(self.progress_file)
+        
+        self.assertEqual(sources, self.done_urls)
+        self.assertEqual(categories, [self.generator.categorize_url(url) for url in self.done_urls])
+        self.assertEqual(complete_size, self.complete_size)
+    
+    def test_resume_progress_truncates_partial_line(self):
+        """Test that resuming marks checkpointed URLs and drops the partial line"""
+        resumed = self.generator.resume_progress("MS_Learn")
+        self.generator._close_progress()
+        
+        self.assertEqual(resumed, 2)
+        self.assertEqual(self.progress_file.stat().st_size, self.complete_size)
+        self.assertFalse(self.progress_file.read_bytes().endswith(self.partial_line))
+    
+    def test_process_url_list_resume(self):
+        """Test that a resumed run skips checkpointed URLs and merges both runs"""
+        with mock.patch.object(self.generator, 'extract_content', side_effect=lambda url, _: self._content(url)) as extract:
+            self.generator.process_url_list(self.done_urls + [self.new_url], resume=True)
+        
+        # Only the URL missing from the checkpoint is fetched
+        self.assertEqual([call.args[0] for call in extract.call_args_list], [self.new_url])
+        
+        # Checkpoint is promoted to the final dataset with every complete item
+        final_file = self.output_dir / "ms_learn_training_data.jsonl"
+        self.assertFalse(self.progress_file.exists())
+        items = [orjson.loads(line) for line in final_file.read_bytes().splitlines()]
+        self.assertEqual(
+            [item['metadata']['source'] for item in items],
+            self.done_urls + [self.new_url]
+        )
+        
+        # Metadata covers the resumed and the new items
+        metadata = json.loads((self.output_dir / "ms_learn_metadata.json").read_text())
+        self.assertEqual(metadata['total_items'], 3)
+        self.assertEqual(metadata['urls_processed'], self.done_urls + [self.new_url])
+        self.assertEqual(sum(metadata['categories'].values()), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,28 +5,36 @@ Unit tests for settings management
 import unittest
 import tempfile
 import json
+import gc
+import weakref
 from pathlib import Path
-import sys
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from config.settings import Settings
+from src.config.settings import Settings
 
 class TestSettings(unittest.TestCase):
     """
     Test cases for Settings class
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Materialize the default settings once for all tests"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cls._default_snapshot = Settings(Path(temp_dir) / "settings.json").to_dict()
+    
     def setUp(self):
         """Set up test fixtures"""
-        # Create temporary config file
+        # Create temporary config file pre-filled with the default snapshot
         self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
+        json.dump(self._default_snapshot, self.temp_file)
         self.temp_file.close()
         self.settings = Settings(self.temp_file.name)
     
     def tearDown(self):
         """Clean up test fixtures"""
+        # Write any deferred save before the file is removed
+        self.settings.flush()
+        
         # Remove temporary file
         Path(self.temp_file.name).unlink(missing_ok=True)
     
@@ -34,6 +42,7 @@ class TestSettings(unittest.TestCase):
         """Test that default settings are loaded"""
         self.assertIsNotNone(self.settings.get("window_size"))
         self.assertEqual(self.settings.get("window_size"), [1200, 800])
+        self.assertIsNone(self.settings.get("window_position"))
         self.assertEqual(self.settings.get("delay_seconds"), 2)
     
     def test_set_and_get(self):
@@ -50,6 +59,39 @@ class TestSettings(unittest.TestCase):
         new_settings = Settings(self.temp_file.name)
         self.assertEqual(new_settings.get("test_key"), "test_value")
     
+    def test_deferred_save(self):
+        """Test that auto-save is deferred until flushed"""
+        self.settings.save()
+        self.settings.set("test_key", "test_value")
+        self.settings.set("test_key", "final_value")
+        
+        on_disk = json.loads(Path(self.temp_file.name).read_text(encoding='utf-8'))
+        self.assertNotIn("test_key", on_disk)
+        
+        self.settings.flush()
+        on_disk = json.loads(Path(self.temp_file.name).read_text(encoding='utf-8'))
+        self.assertEqual(on_disk["test_key"], "final_value")
+    
+    def test_to_dict(self):
+        """Test exporting settings as an independent dictionary"""
+        self.settings.set("test_key", "test_value")
+        exported = self.settings.to_dict()
+        
+        self.assertEqual(exported["test_key"], "test_value")
+        self.assertEqual(exported["window_size"], [1200, 800])
+        
+        exported["test_key"] = "changed"
+        self.assertEqual(self.settings.get("test_key"), "test_value")
+    
+    def test_instance_not_kept_alive(self):
+        """Test that the exit-time flush hook does not pin instances"""
+        instance = Settings(self.temp_file.name)
+        instance_ref = weakref.ref(instance)
+        del instance
+        gc.collect()
+        
+        self.assertIsNone(instance_ref())
+    
     def test_update(self):
         """Test updating multiple settings"""
         updates = {
@@ -96,6 +138,18 @@ class TestSettings(unittest.TestCase):
         recent = self.settings.get("recent_categories")
         self.assertEqual(recent[0], "Category2")
         self.assertEqual(recent[1], "Category1")
+    
+    def test_recent_items_limit(self):
+        """Test recent lists are capped at max_items"""
+        for i in range(5):
+            self.settings.add_recent_url_list(f"file{i}.txt", max_items=3)
+        
+        recent = self.settings.get("recent_url_lists")
+        self.assertEqual(recent, ["file4.txt", "file3.txt", "file2.txt"])
+        
+        # Re-adding the most recent item leaves the list unchanged
+        self.settings.add_recent_url_list("file4.txt", max_items=3)
+        self.assertEqual(self.settings.get("recent_url_lists"), recent)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the persistent URL content cache
+"""
+
+import unittest
+import tempfile
+import itertools
+from pathlib import Path
+from unittest import mock
+
+from src.core.url_cache import URLCache
+
+class TestURLCache(unittest.TestCase):
+    """
+    Test cases for URLCache class
+    """
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.temp_dir.name) / "url_cache.sqlite3"
+        self.cache = URLCache(self.cache_file, max_entries=3)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+    
+    def _fetched_at(self, url):
+        """Read an entry's fetch timestamp straight from the database"""
+        with self.cache._lock:
+            row = self.cache._connection().execute(
+                "SELECT fetched_at FROM url_cache WHERE url = ?", (url,)
+            ).fetchone()
+        return row[0]
+    
+    def test_get_set_round_trip(self):
+        """Test that stored content comes back with its validators"""
+        content_data = {'url': 'https://a', 'title': 'A', 'content': 'Body', 'code_examples': ['x = 1']}
+        self.cache.set('https://a', content_data, etag='"abc"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+        
+        cached = self.cache.get('https://a')
+        self.assertEqual(cached['content_data'], content_data)
+        self.assertEqual(cached['etag'], '"abc"')
+        self.assertEqual(cached['last_modified'], 'Mon, 01 Jan 2024 00:00:00 GMT')
+        self.assertTrue(cached['fresh'])
+        
+        self.assertIsNone(self.cache.get('https://missing'))
+    
+    def test_persists_across_instances(self):
+        """Test that entries survive closing and reopening the cache"""
+        self.cache.set('https://a', {'title': 'A'})
+        self.cache.close()
+        
+        reopened = URLCache(self.cache_file)
+        try:
+            self.assertEqual(reopened.get('https://a')['content_data'], {'title': 'A'})
+        finally:
+            reopened.close()
+    
+    def test_eviction_at_max_entries(self):
+        """Test that the least recently used entry is evicted"""
+        # Strictly increasing timestamps, so coarse clocks can't tie access times
+        with mock.patch('src.core.url_cache.time.time', side_effect=itertools.count(1000.0).__next__):
+            for url in ('https://a', 'https://b', 'https://c'):
+                self.cache.set(url, {'url': url})
+            
+            # Reading 'a' makes 'b' the least recently used entry
+            self.cache.get('https://a')
+            self.cache.set('https://d', {'url': 'https://d'})
+            
+            self.assertIsNone(self.cache.get('https://b'))
+            for url in ('https://a', 'https://c', 'https://d'):
+                self.assertIsNotNone(self.cache.get(url))
+    
+    def test_stale_entry(self):
+        """Test that expired entries are still returned but marked stale"""
+        self.cache.max_age_seconds = 0
+        self.cache.set('https://a', {'title': 'A'}, etag='"abc"')
+        
+        cached = self.cache.get('https://a')
+        self.assertFalse(cached['fresh'])
+        self.assertEqual(cached['content_data'], {'title': 'A'})
+        self.assertEqual(cached['etag'], '"abc"')
+    
+    def test_touch_refreshes_fetched_at(self):
+        """Test that touch makes a stale entry fresh again"""
+        self.cache.max_age_seconds = 60
+        self.cache.set('https://a', {'title': 'A'})
+        
+        # Age the entry past the freshness window
+        with self.cache._lock:
+            conn = self.cache._connection()
+            conn.execute("UPDATE url_cache SET fetched_at = fetched_at - 120 WHERE url = ?", ('https://a',))
+            conn.commit()
+        stale_fetched_at = self._fetched_at('https://a')
+        self.assertFalse(self.cache.get('https://a')['fresh'])
+        
+        self.cache.touch('https://a')
+        
+        self.assertGreater(self._fetched_at('https://a'), stale_fetched_at)
+        self.assertTrue(self.cache.get('https://a')['fresh'])
+
+if __name__ == '__main__':
+    unittest.main()
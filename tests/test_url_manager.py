@@ -0,0 +1,113 @@
+"""
+Unit tests for URL validation and management
+"""
+
+import unittest
+import tkinter
+
+try:
+    import customtkinter as ctk
+    from src.gui.components import url_manager
+except ImportError:  # customtkinter is not installed
+    url_manager = None
+
+MALFORMED_URL = "http://[abc/x"
+
+@unittest.skipIf(url_manager is None, "customtkinter is not installed")
+class TestURLValidation(unittest.TestCase):
+    """
+    Test cases for MS Learn URL validation
+    """
+    
+    def test_mslearn_urls(self):
+        """Test that MS Learn URLs match in any case"""
+        for url in (
+            "https://learn.microsoft.com/en-us/windows-server/networking/dns/dns-overview",
+            "HTTPS://Learn.Microsoft.com/en-us/windows-server",
+            "http://docs.learn.microsoft.com:443/en-us/powershell",
+        ):
+            self.assertTrue(url_manager._match_mslearn(url), url)
+    
+    def test_other_urls(self):
+        """Test that other sites and malformed URLs are rejected"""
+        for url in (
+            "https://example.com/invalid-url",
+            "https://Example.com/learn.microsoft.com",
+            "https://learn.microsoft.com/",
+            MALFORMED_URL,
+            "",
+        ):
+            self.assertFalse(url_manager._match_mslearn(url), url)
+    
+    def test_validate_batch(self):
+        """Test that batch validation agrees with single-URL validation"""
+        urls = [
+            "https://learn.microsoft.com/en-us/windows-server/networking/dns/dns-overview",
+            "https://example.com/invalid-url",
+            MALFORMED_URL,
+            "HTTPS://Learn.Microsoft.com/en-us/powershell",
+        ]
+        
+        self.assertEqual(url_manager._validate_batch(urls), [True, False, False, True])
+        self.assertEqual(url_manager._validate_batch(urls), list(map(url_manager._validate_mslearn, urls)))
+    
+    def test_canonicalize_malformed_url(self):
+        """Test that a malformed URL is kept as typed instead of raising"""
+        self.assertEqual(url_manager._canonicalize(f" {MALFORMED_URL} "), MALFORMED_URL)
+        self.assertEqual(url_manager.URLItem(MALFORMED_URL).canonical, MALFORMED_URL)
+
+@unittest.skipIf(url_manager is None, "customtkinter is not installed")
+class TestURLManager(unittest.TestCase):
+    """
+    Test cases for URLManager class
+    """
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        try:
+            self.root = ctk.CTk()
+        except tkinter.TclError as e:  # No display available
+            self.skipTest(f"Tk is not available: {e}")
+        self.manager = url_manager.URLManager(self.root)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.manager.destroy()
+        self.root.destroy()
+    
+    def test_add_malformed_url(self):
+        """Test that a malformed URL is listed as invalid"""
+        self.assertTrue(self.manager.add_url(MALFORMED_URL))
+        self.assertFalse(self.manager.add_url(MALFORMED_URL))
+        
+        self.assertEqual(self.manager.url_count, 1)
+        self.assertEqual(self.manager.get_status_counts()["invalid"], 1)
+    
+    def test_add_url_many_with_malformed_url(self):
+        """Test that a malformed URL does not abort a bulk add"""
+        urls = [
+            "https://learn.microsoft.com/en-us/windows-server/networking/dns/dns-overview",
+            MALFORMED_URL,
+            "https://learn.microsoft.com/en-us/powershell/scripting/overview",
+        ]
+        
+        self.assertEqual(self.manager.add_url_many(urls), 3)
+        self.assertEqual(self.manager.get_urls(), urls)
+        counts = self.manager.get_status_counts()
+        self.assertEqual(counts["ready"], 2)
+        self.assertEqual(counts["invalid"], 1)
+    
+    def test_status_update_for_malformed_url(self):
+        """Test that status polling survives an update for a malformed URL"""
+        self.manager.add_url(MALFORMED_URL)
+        self.manager.update_url_status(MALFORMED_URL, "failed", error_message="Bad URL")
+        
+        # Drain now instead of waiting for the scheduled poll
+        self.manager.after_cancel(self.manager._drain_after_id)
+        self.manager._drain_updates()
+        
+        self.assertEqual(self.manager.get_url_items()[0].status, "failed")
+        self.assertIsNotNone(self.manager._drain_after_id)
+
+if __name__ == '__main__':
+    unittest.main()